@@ -5,8 +5,31 @@ Handles all API interactions with Firefly III instance
 
 import requests
 import json
-from typing import Dict, List, Optional, Tuple
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Number of keep-alive connections kept open per host; bulk operations size
+# their worker pools to this so threads never queue for a connection
+POOL_SIZE = 16
+
+
+class _CreateSafeRetry(Retry):
+    """
+    Retry policy that only resends a POST the server did not process.
+
+    POST is left out of allowed_methods, so it is never retried after a read
+    timeout or a 502/504, where the object may already have been created.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == 'POST':
+            # Rate limited, or unavailable and asking the client to come back
+            return status_code == 429 or (status_code == 503 and has_retry_after)
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class FireflyAPIClient:
@@ -28,6 +51,29 @@ class FireflyAPIClient:
             'Accept': 'application/json'
         }
 
+        # Reuse connections across calls instead of a new TCP/TLS handshake per request.
+        # Transient failures (including rate limiting) are retried inside urllib3, honouring
+        # Retry-After. Creates are only retried on 429 and on 503 with Retry-After, where the
+        # server did not process them; a resent POST that had already been saved would come
+        # back as a 422 and turn a successful create into a reported failure. After the last
+        # attempt the final response is returned so callers still report the server's message.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=_CreateSafeRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # ETag of the last complete single-page get_all_accounts() response, if the server sent one
+        self.last_accounts_etag: Optional[str] = None
+
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test API connection
@@ -36,7 +82,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/about',
                 headers=self.headers,
                 timeout=10
@@ -63,7 +109,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, rules: List[Dict] or None, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/rules',
                 headers=self.headers,
                 params={'page': page, 'limit': limit},
@@ -91,7 +137,7 @@ class FireflyAPIClient:
 
         try:
             while True:
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/api/v1/rules',
                     headers=self.headers,
                     params={'page': page},
@@ -110,8 +156,8 @@ class FireflyAPIClient:
                 all_rules.extend(rules)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -135,7 +181,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/rules/{rule_id}',
                 headers=self.headers,
                 timeout=10
@@ -168,7 +214,7 @@ class FireflyAPIClient:
                 # Data might be wrapped in attributes
                 payload = rule_data.get('attributes', rule_data)
 
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/rules',
                 headers=self.headers,
                 json=payload,
@@ -268,7 +314,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, categories: List[Dict] or None, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/categories',
                 headers=self.headers,
                 params={'page': page, 'limit': limit},
@@ -296,7 +342,7 @@ class FireflyAPIClient:
 
         try:
             while True:
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/api/v1/categories',
                     headers=self.headers,
                     params={'page': page},
@@ -315,8 +361,8 @@ class FireflyAPIClient:
                 all_categories.extend(categories)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -340,7 +386,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/categories/{category_id}',
                 headers=self.headers,
                 timeout=10
@@ -372,10 +418,11 @@ class FireflyAPIClient:
                 # Data might be wrapped in attributes
                 payload = category_data.get('attributes', category_data)
 
-            response = requests.post(
+            # Serialized with orjson; self.headers already sets Content-Type: application/json
+            response = self.session.post(
                 f'{self.base_url}/api/v1/categories',
                 headers=self.headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
 
@@ -404,6 +451,33 @@ class FireflyAPIClient:
         except requests.exceptions.RequestException as e:
             return False, None, f"Error creating category: {str(e)}"
 
+    def create_categories(self, categories_data: List[Dict], max_workers: int = POOL_SIZE) -> Iterator[Tuple[int, Tuple[bool, Optional[Dict], str]]]:
+        """
+        Create several categories concurrently over the pooled session
+
+        Firefly III has no bulk endpoint for categories (the only bulk route,
+        /api/v1/data/bulk/transactions, updates transactions), so each category
+        is still its own POST; they are overlapped instead of batched.
+
+        Args:
+            categories_data: List of category data dictionaries (as accepted by create_category)
+            max_workers: Maximum number of requests in flight at once
+
+        Yields:
+            Tuple of (index into categories_data, create_category result) as each request completes
+        """
+        if not categories_data:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(categories_data))) as executor:
+            futures = {
+                executor.submit(self.create_category, category_data): index
+                for index, category_data in enumerate(categories_data)
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def update_category(self, category_id: int, category_data: Dict) -> Tuple[bool, Optional[Dict], str]:
         """
         Update an existing category
@@ -424,7 +498,7 @@ class FireflyAPIClient:
                 # Data might be wrapped in attributes
                 payload = category_data.get('attributes', category_data)
 
-            response = requests.put(
+            response = self.session.put(
                 f'{self.base_url}/api/v1/categories/{category_id}',
                 headers=self.headers,
                 json=payload,
@@ -528,7 +602,7 @@ class FireflyAPIClient:
             if account_type:
                 params['type'] = account_type
 
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/accounts',
                 headers=self.headers,
                 params=params,
@@ -544,12 +618,89 @@ class FireflyAPIClient:
         except requests.exceptions.RequestException as e:
             return False, None, f"Error retrieving accounts: {str(e)}"
 
-    def get_all_accounts(self, account_type: Optional[str] = None) -> Tuple[bool, Optional[List[Dict]], str]:
+    def get_all_accounts(self, account_type: Optional[str] = None, etag: Optional[str] = None) -> Tuple[bool, Optional[List[Dict]], str]:
         """
         Get ALL accounts from Firefly III (handles pagination automatically)
 
+        The first page reports the page count; any remaining pages are then
+        fetched concurrently over the pooled session and joined in page order.
+
+        An ETag is only kept (in last_accounts_etag) when the whole result fits
+        on one page, since a first-page ETag says nothing about later pages.
+
         Args:
             account_type: Optional filter by account type (asset, expense, revenue, liability, etc.)
+            etag: ETag from a previous call, sent as If-None-Match
+
+        Returns:
+            Tuple of (success: bool, accounts: List[Dict] or None, message: str);
+            accounts is None on success if the server answered 304 Not Modified
+        """
+        def fetch_page(page: int, headers: Dict = self.headers) -> Tuple[Optional[requests.Response], Optional[str]]:
+            params = {'page': page}
+            if account_type:
+                params['type'] = account_type
+
+            response = self.session.get(
+                f'{self.base_url}/api/v1/accounts',
+                headers=headers,
+                params=params,
+                timeout=10
+            )
+
+            if response.status_code not in (200, 304):
+                return None, f"Failed to get accounts: {response.status_code} - {response.text}"
+
+            return response, None
+
+        self.last_accounts_etag = None
+
+        try:
+            first_page_headers = {**self.headers, 'If-None-Match': etag} if etag else self.headers
+            response, error = fetch_page(1, first_page_headers)
+            if error:
+                return False, None, error
+
+            if response.status_code == 304:
+                self.last_accounts_etag = etag
+                return True, None, "Accounts not modified since last refresh"
+
+            data = response.json()
+
+            all_accounts = list(data.get('data', []))
+
+            # Check if there are more pages
+            meta = data.get('meta') or {}
+            pagination = meta.get('pagination') or {}
+            total_pages = pagination.get('total_pages', 1)
+
+            if all_accounts and total_pages > 1:
+                remaining_pages = range(2, total_pages + 1)
+                with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(remaining_pages))) as executor:
+                    results = list(executor.map(fetch_page, remaining_pages))
+
+                for page_response, error in results:
+                    if error:
+                        return False, None, error
+                    all_accounts.extend(page_response.json().get('data', []))
+            else:
+                self.last_accounts_etag = response.headers.get('ETag')
+
+            return True, all_accounts, f"Retrieved {len(all_accounts)} accounts"
+        except requests.exceptions.RequestException as e:
+            return False, None, f"Error retrieving accounts: {str(e)}"
+
+    def search_accounts(self, query: str, account_type: Optional[str] = None, field: str = 'name') -> Tuple[bool, Optional[List[Dict]], str]:
+        """
+        Search accounts by name (or another field) without fetching the full account list
+
+        Firefly III matches the query as a substring, so a short name can match
+        more than one page; every page of matches is returned.
+
+        Args:
+            query: Text to search for; Firefly III matches it as a substring
+            account_type: Optional filter by account type (asset, expense, revenue, liability, etc.)
+            field: Field to search in (all, iban, name, number, id)
 
         Returns:
             Tuple of (success: bool, accounts: List[Dict] or None, message: str)
@@ -559,19 +710,19 @@ class FireflyAPIClient:
 
         try:
             while True:
-                params = {'page': page}
+                params = {'query': query, 'field': field, 'page': page}
                 if account_type:
                     params['type'] = account_type
 
-                response = requests.get(
-                    f'{self.base_url}/api/v1/accounts',
+                response = self.session.get(
+                    f'{self.base_url}/api/v1/search/accounts',
                     headers=self.headers,
                     params=params,
                     timeout=10
                 )
 
                 if response.status_code != 200:
-                    return False, None, f"Failed to get accounts: {response.status_code} - {response.text}"
+                    return False, None, f"Failed to search accounts: {response.status_code} - {response.text}"
 
                 data = response.json()
                 accounts = data.get('data', [])
@@ -582,8 +733,8 @@ class FireflyAPIClient:
                 all_accounts.extend(accounts)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -592,9 +743,9 @@ class FireflyAPIClient:
 
                 page += 1
 
-            return True, all_accounts, f"Retrieved {len(all_accounts)} accounts"
+            return True, all_accounts, f"Found {len(all_accounts)} accounts"
         except requests.exceptions.RequestException as e:
-            return False, None, f"Error retrieving accounts: {str(e)}"
+            return False, None, f"Error searching accounts: {str(e)}"
 
     def delete_account(self, account_id: int) -> Tuple[bool, str]:
         """
@@ -607,7 +758,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/accounts/{account_id}',
                 headers=self.headers,
                 timeout=10
@@ -620,6 +771,29 @@ class FireflyAPIClient:
         except requests.exceptions.RequestException as e:
             return False, f"Error deleting account: {str(e)}"
 
+    def delete_accounts(self, account_ids: List[int], max_workers: int = POOL_SIZE) -> Iterator[Tuple[int, Tuple[bool, str]]]:
+        """
+        Delete several accounts concurrently over the pooled session
+
+        Args:
+            account_ids: List of account IDs to delete
+            max_workers: Maximum number of requests in flight at once
+
+        Yields:
+            Tuple of (account ID, delete_account result) as each request completes
+        """
+        if not account_ids:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(account_ids))) as executor:
+            futures = {
+                executor.submit(self.delete_account, account_id): account_id
+                for account_id in account_ids
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def create_account(self, account_data: Dict) -> Tuple[bool, Optional[Dict], str]:
         """
         Create a new account
@@ -639,10 +813,11 @@ class FireflyAPIClient:
                 # Data might be wrapped in attributes
                 payload = account_data.get('attributes', account_data)
 
-            response = requests.post(
+            # Serialized with orjson; self.headers already sets Content-Type: application/json
+            response = self.session.post(
                 f'{self.base_url}/api/v1/accounts',
                 headers=self.headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
 
@@ -671,6 +846,32 @@ class FireflyAPIClient:
         except requests.exceptions.RequestException as e:
             return False, None, f"Error creating account: {str(e)}"
 
+    def create_accounts(self, accounts_data: List[Dict], max_workers: int = POOL_SIZE) -> Iterator[Tuple[int, Tuple[bool, Optional[Dict], str]]]:
+        """
+        Create several accounts concurrently over the pooled session
+
+        Firefly III has no bulk endpoint for accounts, so each account is still
+        its own POST; they are overlapped instead of batched.
+
+        Args:
+            accounts_data: List of account data dictionaries (as accepted by create_account)
+            max_workers: Maximum number of requests in flight at once
+
+        Yields:
+            Tuple of (index into accounts_data, create_account result) as each request completes
+        """
+        if not accounts_data:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(accounts_data))) as executor:
+            futures = {
+                executor.submit(self.create_account, account_data): index
+                for index, account_data in enumerate(accounts_data)
+            }
+
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def update_account(self, account_id: int, account_data: Dict) -> Tuple[bool, Optional[Dict], str]:
         """
         Update an existing account
@@ -691,7 +892,7 @@ class FireflyAPIClient:
                 # Data might be wrapped in attributes
                 payload = account_data.get('attributes', account_data)
 
-            response = requests.put(
+            response = self.session.put(
                 f'{self.base_url}/api/v1/accounts/{account_id}',
                 headers=self.headers,
                 json=payload,
@@ -792,7 +993,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, budgets: List[Dict] or None, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/budgets',
                 headers=self.headers,
                 params={'page': page, 'limit': limit},
@@ -820,7 +1021,7 @@ class FireflyAPIClient:
 
         try:
             while True:
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/api/v1/budgets',
                     headers=self.headers,
                     params={'page': page},
@@ -839,8 +1040,8 @@ class FireflyAPIClient:
                 all_budgets.extend(budgets)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -864,7 +1065,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/budgets/{budget_id}',
                 headers=self.headers,
                 timeout=10
@@ -893,7 +1094,7 @@ class FireflyAPIClient:
             else:
                 payload = budget_data.get('attributes', budget_data)
 
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/budgets',
                 headers=self.headers,
                 json=payload,
@@ -940,7 +1141,7 @@ class FireflyAPIClient:
             else:
                 payload = budget_data.get('attributes', budget_data)
 
-            response = requests.put(
+            response = self.session.put(
                 f'{self.base_url}/api/v1/budgets/{budget_id}',
                 headers=self.headers,
                 json=payload,
@@ -983,7 +1184,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, bills: List[Dict] or None, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/bills',
                 headers=self.headers,
                 params={'page': page, 'limit': limit},
@@ -1011,7 +1212,7 @@ class FireflyAPIClient:
 
         try:
             while True:
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/api/v1/bills',
                     headers=self.headers,
                     params={'page': page},
@@ -1030,8 +1231,8 @@ class FireflyAPIClient:
                 all_bills.extend(bills)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -1055,7 +1256,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/bills/{bill_id}',
                 headers=self.headers,
                 timeout=10
@@ -1084,7 +1285,7 @@ class FireflyAPIClient:
             else:
                 payload = bill_data.get('attributes', bill_data)
 
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/bills',
                 headers=self.headers,
                 json=payload,
@@ -1131,7 +1332,7 @@ class FireflyAPIClient:
             else:
                 payload = bill_data.get('attributes', bill_data)
 
-            response = requests.put(
+            response = self.session.put(
                 f'{self.base_url}/api/v1/bills/{bill_id}',
                 headers=self.headers,
                 json=payload,
@@ -1174,7 +1375,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, piggy_banks: List[Dict] or None, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/api/v1/piggy-banks',
                 headers=self.headers,
                 params={'page': page, 'limit': limit},
@@ -1202,7 +1403,7 @@ class FireflyAPIClient:
 
         try:
             while True:
-                response = requests.get(
+                response = self.session.get(
                     f'{self.base_url}/api/v1/piggy-banks',
                     headers=self.headers,
                     params={'page': page},
@@ -1221,8 +1422,8 @@ class FireflyAPIClient:
                 all_piggy_banks.extend(piggy_banks)
 
                 # Check if there's a next page
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
+                meta = data.get('meta') or {}
+                pagination = meta.get('pagination') or {}
                 current_page = pagination.get('current_page', page)
                 total_pages = pagination.get('total_pages', 1)
 
@@ -1246,7 +1447,7 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.delete(
+            response = self.session.delete(
                 f'{self.base_url}/api/v1/piggy-banks/{piggy_bank_id}',
                 headers=self.headers,
                 timeout=10
@@ -1275,7 +1476,7 @@ class FireflyAPIClient:
             else:
                 payload = piggy_bank_data.get('attributes', piggy_bank_data)
 
-            response = requests.post(
+            response = self.session.post(
                 f'{self.base_url}/api/v1/piggy-banks',
                 headers=self.headers,
                 json=payload,
@@ -1322,7 +1523,7 @@ class FireflyAPIClient:
             else:
                 payload = piggy_bank_data.get('attributes', piggy_bank_data)
 
-            response = requests.put(
+            response = self.session.put(
                 f'{self.base_url}/api/v1/piggy-banks/{piggy_bank_id}',
                 headers=self.headers,
                 json=payload,
@@ -39,10 +39,11 @@ if 'firefly_url' not in st.session_state:
     st.session_state.firefly_url = get_firefly_url()
 if 'firefly_token' not in st.session_state:
     st.session_state.firefly_token = get_firefly_token()
-if 'asset_accounts_cache' not in st.session_state:
-    st.session_state.asset_accounts_cache = None
-if 'last_refresh_asset' not in st.session_state:
-    st.session_state.last_refresh_asset = None
+# Accounts are cached per account type, shared across the account management pages
+if 'accounts_cache' not in st.session_state:
+    st.session_state.accounts_cache = {}
+if 'accounts_refresh_ts' not in st.session_state:
+    st.session_state.accounts_refresh_ts = {}
 
 # Auto-connect if credentials are available
 if not st.session_state.api_connected and st.session_state.firefly_url and st.session_state.firefly_token:
@@ -103,18 +104,18 @@ else:
                 with st.spinner(f"Fetching {ACCOUNT_TYPE_DISPLAY.lower()} accounts from Firefly III..."):
                     success, accounts, message = client.get_all_accounts(account_type=ACCOUNT_TYPE)
                     if success:
-                        st.session_state.asset_accounts_cache = accounts
-                        st.session_state.last_refresh_asset = pd.Timestamp.now()
+                        st.session_state.accounts_cache[ACCOUNT_TYPE] = accounts
+                        st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = pd.Timestamp.now()
                         st.success(message)
                     else:
                         st.error(message)
 
         with col2:
-            if st.session_state.last_refresh_asset:
-                st.caption(f"Last refresh: {st.session_state.last_refresh_asset.strftime('%H:%M:%S')}")
+            if st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE):
+                st.caption(f"Last refresh: {st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE).strftime('%H:%M:%S')}")
 
-        if st.session_state.asset_accounts_cache is not None:
-            accounts = st.session_state.asset_accounts_cache
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is not None:
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) == 0:
                 st.info(f"No {ACCOUNT_TYPE_DISPLAY.lower()} accounts found in your Firefly III instance")
@@ -338,9 +339,13 @@ else:
                             with st.expander("View Created Account", expanded=True):
                                 st.json(created_account)
 
-                            # Clear cache to force refresh
-                            st.session_state.asset_accounts_cache = None
-                            st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the new account")
+                            # Add the new account to the cached list instead of forcing a re-fetch
+                            cached_accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
+                            if cached_accounts is not None:
+                                cached_accounts.append(created_account)
+                                st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = pd.Timestamp.now()
+                            else:
+                                st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the new account")
                         else:
                             st.error(f"❌ {message}")
 
@@ -348,8 +353,8 @@ else:
         st.markdown("### Edit Existing Account")
         st.markdown("To edit an account, first refresh the accounts list in the 'View & Export Accounts' tab.")
 
-        if st.session_state.asset_accounts_cache is not None:
-            accounts = st.session_state.asset_accounts_cache
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is not None:
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) > 0:
                 with st.form("update_account_form"):
@@ -451,9 +456,12 @@ else:
                                         with st.expander("View Updated Account", expanded=True):
                                             st.json(updated_account)
 
-                                        # Clear cache to force refresh
-                                        st.session_state.asset_accounts_cache = None
-                                        st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the changes")
+                                        # Swap the updated account into the cached list instead of forcing a re-fetch
+                                        accounts[:] = [
+                                            updated_account if a.get('id') == selected_account_id else a
+                                            for a in accounts
+                                        ]
+                                        st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = pd.Timestamp.now()
                                     else:
                                         st.error(f"❌ {message}")
 
@@ -462,10 +470,10 @@ else:
         st.subheader(f"Delete {ACCOUNT_TYPE_DISPLAY} Accounts")
         st.warning("⚠️ **Warning:** Deleting accounts is permanent and cannot be undone!")
 
-        if st.session_state.asset_accounts_cache is None:
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is None:
             st.info("Please refresh accounts in the 'View & Export Accounts' tab first")
         else:
-            accounts = st.session_state.asset_accounts_cache
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) == 0:
                 st.info(f"No {ACCOUNT_TYPE_DISPLAY.lower()} accounts to delete")
@@ -573,7 +581,7 @@ else:
                                         st.text(error)
 
                             # Clear cache to force refresh
-                            st.session_state.asset_accounts_cache = None
+                            st.session_state.accounts_cache.pop(ACCOUNT_TYPE, None)
                             st.info("Please refresh the accounts list in the 'View & Export Accounts' tab")
 
     # TAB 4: Import Accounts
@@ -753,7 +761,7 @@ else:
                                             st.text(error)
 
                                 # Clear cache to force refresh
-                                st.session_state.asset_accounts_cache = None
+                                st.session_state.accounts_cache.pop(ACCOUNT_TYPE, None)
                                 st.info("Please refresh the accounts list in the 'View & Export Accounts' tab to see imported accounts")
 
             except json.JSONDecodeError as e:
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.navigation import render_sidebar_navigation
 from utils.config import get_firefly_url, get_firefly_token
+from utils.calculations import calculate_net_worth
 
 # Page configuration
 st.set_page_config(
@@ -190,17 +191,6 @@ class FireflyAPIClient:
         return pd.DataFrame(accounts)
 
 
-def calculate_net_worth(df: pd.DataFrame) -> Dict[str, float]:
-    """Calculate net worth by currency"""
-    # Filter accounts that should be included in net worth
-    net_worth_accounts = df[df['include_net_worth'] == True]
-
-    # Group by currency and sum balances
-    net_worth_by_currency = net_worth_accounts.groupby('currency_code')['current_balance'].sum().to_dict()
-
-    return net_worth_by_currency
-
-
 def create_account_type_chart(df: pd.DataFrame, currency: str = None) -> go.Figure:
     """Create pie chart showing balance by account type for a specific currency"""
     # Filter accounts included in net worth
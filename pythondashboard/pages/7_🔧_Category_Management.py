@@ -6,6 +6,8 @@ Export, view, create, update, delete, and import categories
 import streamlit as st
 import pandas as pd
 import json
+import orjson
+from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -28,6 +30,61 @@ render_sidebar_navigation()
 st.title("🔧 Category Management")
 st.markdown("Manage your Firefly III categories: export, view, create, update, delete, and import")
 
+
+class CategoryFetchError(Exception):
+    """Raised by get_categories when Firefly III does not return the categories"""
+
+
+# Cache category fetching; cleared after every create/update/delete/import
+@st.cache_data(ttl=60, show_spinner=False)
+def get_categories(base_url, token):
+    """Fetch all categories with caching; failures raise so they are never cached"""
+    success, categories, message = FireflyAPIClient(base_url, token).get_all_categories()
+    if not success:
+        raise CategoryFetchError(message)
+    return categories, message, datetime.now()
+
+
+# Keys change on every refresh, so keep only the latest few tables in the process-wide cache
+@st.cache_data(show_spinner=False, max_entries=4)
+def categories_to_df(refresh_key, _categories):
+    """Build the categories table and its summary counts, cached per refresh so filter reruns skip the rebuild"""
+    categories_data = []
+    categories_with_notes = 0
+    categories_with_spending = 0
+    for category in _categories:
+        attrs = category.get('attributes') or {}
+        name = attrs.get('name', 'N/A')
+        notes = attrs.get('notes') or ''
+        spent_data = attrs.get('spent') or ()
+
+        # Get spending data
+        total_spent = 0
+        if spent_data and spent_data[0]:
+            spent_sum = float(spent_data[0].get('sum', '0'))
+            total_spent = abs(spent_sum)
+            if spent_sum != 0:
+                categories_with_spending += 1
+
+        if notes:
+            categories_with_notes += 1
+        notes_display = notes[:50] + '...' if len(notes) > 50 else notes
+
+        created_at = attrs.get('created_at') or 'N/A'
+        updated_at = attrs.get('updated_at') or 'N/A'
+
+        categories_data.append({
+            'ID': category.get('id'),
+            'Name': name,
+            'Notes': notes_display,
+            'Spent (Last 365d)': f"€{total_spent:,.2f}",
+            'Created': created_at[:10] if created_at != 'N/A' else 'N/A',
+            'Updated': updated_at[:10] if updated_at != 'N/A' else 'N/A'
+        })
+
+    return pd.DataFrame(categories_data), categories_with_notes, categories_with_spending
+
+
 # Initialize session state for API connection
 if 'api_connected' not in st.session_state:
     st.session_state.api_connected = False
@@ -35,12 +92,8 @@ if 'firefly_url' not in st.session_state:
     st.session_state.firefly_url = get_firefly_url()
 if 'firefly_token' not in st.session_state:
     st.session_state.firefly_token = get_firefly_token()
-if 'categories_cache' not in st.session_state:
-    st.session_state.categories_cache = None
-if 'last_refresh_categories' not in st.session_state:
-    st.session_state.last_refresh_categories = None
-if 'last_refresh' not in st.session_state:
-    st.session_state.last_refresh = None
+if 'export_filename_default' not in st.session_state:
+    st.session_state.export_filename_default = f"firefly_categories_export_{datetime.now():%Y%m%d_%H%M%S}.json"
 
 # Auto-connect if credentials are available
 if not st.session_state.api_connected and st.session_state.firefly_url and st.session_state.firefly_token:
@@ -82,88 +135,57 @@ else:
     # Recreate client from stored credentials (compatible with Dashboard pages)
     client = FireflyAPIClient(st.session_state.firefly_url, st.session_state.firefly_token)
 
-    # Create tabs for different operations
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📋 View & Export Categories",
-        "➕ Create Category",
-        "🗑️ Delete Categories",
-        "📥 Import Categories"
-    ])
+    def load_categories():
+        """Return (categories or None, message, fetched_at) from the cached fetch"""
+        with st.spinner("Fetching categories from Firefly III..."):
+            try:
+                return get_categories(
+                    st.session_state.firefly_url,
+                    st.session_state.firefly_token
+                )
+            except CategoryFetchError as e:
+                return None, str(e), datetime.now()
 
+    # Each tab is a fragment so its widgets only rerun that tab, not the whole page
     # TAB 1: View & Export Categories
-    with tab1:
+    @st.fragment
+    def view_export_tab():
+        """Render the view & export tab"""
+        categories_cache, categories_message, last_refresh = load_categories()
+
         st.subheader("View & Export Categories")
 
         col1, col2 = st.columns([3, 1])
 
         with col1:
             if st.button("🔄 Refresh Categories", type="primary"):
-                with st.spinner("Fetching categories from Firefly III..."):
-                    success, categories, message = client.get_all_categories()
-                    if success:
-                        st.session_state.categories_cache = categories
-                        st.session_state.last_refresh = pd.Timestamp.now()
-                        st.success(message)
-                    else:
-                        st.error(message)
+                get_categories.clear()
+                st.rerun()
 
         with col2:
-            if st.session_state.last_refresh:
-                st.caption(f"Last refresh: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
+            st.caption(f"Last refresh: {last_refresh.strftime('%H:%M:%S')}")
 
-        if st.session_state.categories_cache is not None:
-            categories = st.session_state.categories_cache
+        if categories_cache is None:
+            st.error(categories_message)
+        else:
+            categories = categories_cache
 
             if len(categories) == 0:
                 st.info("No categories found in your Firefly III instance")
             else:
+                # Convert categories to DataFrame for display, counting the
+                # summary metrics in the same pass
+                df, categories_with_notes, categories_with_spending = categories_to_df(last_refresh, categories)
+
                 # Display summary metrics
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total Categories", len(categories))
                 with col2:
-                    # Count categories with notes
-                    categories_with_notes = sum(1 for c in categories
-                                               if c.get('attributes', {}).get('notes'))
                     st.metric("With Notes", categories_with_notes)
                 with col3:
-                    # Count categories spent last 365 days
-                    categories_with_spending = 0
-                    for c in categories:
-                        spent_data = c.get('attributes', {}).get('spent', [])
-                        if spent_data and len(spent_data) > 0 and spent_data[0]:
-                            spent_sum = float(spent_data[0].get('sum', '0'))
-                            if spent_sum != 0:
-                                categories_with_spending += 1
                     st.metric("With Spending", categories_with_spending)
 
-                # Convert categories to DataFrame for display
-                categories_data = []
-                for category in categories:
-                    attrs = category.get('attributes', {})
-                    # Get spending data
-                    spent_data = attrs.get('spent', [])
-                    total_spent = 0
-                    if spent_data and len(spent_data) > 0 and spent_data[0]:
-                        total_spent = abs(float(spent_data[0].get('sum', '0')))
-
-                    notes = attrs.get('notes') or ''
-                    notes_display = notes[:50] + '...' if len(notes) > 50 else notes
-
-                    created_at = attrs.get('created_at') or 'N/A'
-                    updated_at = attrs.get('updated_at') or 'N/A'
-
-                    categories_data.append({
-                        'ID': category.get('id'),
-                        'Name': attrs.get('name', 'N/A'),
-                        'Notes': notes_display,
-                        'Spent (Last 365d)': f"€{total_spent:,.2f}",
-                        'Created': created_at[:10] if created_at != 'N/A' else 'N/A',
-                        'Updated': updated_at[:10] if updated_at != 'N/A' else 'N/A'
-                    })
-
-                df = pd.DataFrame(categories_data)
-
                 # Filter options
                 st.markdown("**Filter Categories**")
                 col1, col2 = st.columns(2)
@@ -175,11 +197,11 @@ else:
                     show_with_spending_only = st.checkbox("Show only categories with spending")
 
                 # Apply filters
-                filtered_df = df.copy()
+                filtered_df = df
 
                 if search_term:
                     filtered_df = filtered_df[
-                        filtered_df['Name'].str.contains(search_term, case=False, na=False)
+                        filtered_df['Name'].str.contains(search_term, case=False, na=False, regex=False)
                     ]
 
                 if show_with_spending_only:
@@ -188,16 +210,20 @@ else:
                 st.markdown(f"**Categories List** ({len(filtered_df)} categories)")
                 st.dataframe(filtered_df, width='stretch', height=400)
 
+                # Index categories by ID for O(1) lookups in the widgets below
+                id_to_name = dict(zip(df['ID'], df['Name']))
+                categories_by_id = {c.get('id'): c for c in categories}
+
                 # Expandable details for each category
                 with st.expander("📄 View Detailed Category Information"):
                     selected_category_id = st.selectbox(
                         "Select a category to view details",
-                        options=[c['ID'] for c in categories_data],
-                        format_func=lambda x: f"ID {x}: {next((c['Name'] for c in categories_data if c['ID'] == x), 'N/A')}"
+                        options=list(id_to_name),
+                        format_func=lambda x: f"ID {x}: {id_to_name.get(x, 'N/A')}"
                     )
 
                     if selected_category_id:
-                        category = next((c for c in categories if c.get('id') == selected_category_id), None)
+                        category = categories_by_id.get(selected_category_id)
                         if category:
                             attrs = category.get('attributes', {})
 
@@ -243,7 +269,7 @@ else:
                 with col1:
                     export_filename = st.text_input(
                         "Export filename",
-                        value=f"firefly_categories_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json"
+                        value=st.session_state.export_filename_default
                     )
 
                 with col2:
@@ -253,7 +279,7 @@ else:
                     if st.button("💾 Export All Categories", type="primary"):
                         # Create export data
                         export_data = {
-                            'export_date': pd.Timestamp.now().isoformat(),
+                            'export_date': datetime.now().isoformat(),
                             'firefly_iii_categories_export': True,
                             'total_categories': len(categories),
                             'categories': categories
@@ -273,7 +299,11 @@ else:
                         st.success(f"✅ Prepared {len(categories)} categories for export")
 
     # TAB 2: Create Category
-    with tab2:
+    @st.fragment
+    def create_tab():
+        """Render the create & edit tab"""
+        categories_cache, _, _ = load_categories()
+
         st.subheader("Create New Category")
 
         with st.form("create_category_form"):
@@ -316,38 +346,40 @@ else:
                             with st.expander("View Created Category", expanded=True):
                                 st.json(created_category)
 
-                            # Clear cache to force refresh
-                            st.session_state.categories_cache = None
-                            st.info("💡 Refresh the categories list in the 'View & Export Categories' tab to see the new category")
+                            # Clear cache so the next run re-fetches
+                            get_categories.clear()
+                            st.info("💡 The categories list will include the new category on the next refresh")
                         else:
                             st.error(f"❌ {message}")
 
         st.markdown("---")
         st.markdown("### Edit Existing Category")
-        st.markdown("To edit a category, first refresh the categories list in the 'View & Export Categories' tab.")
 
-        if st.session_state.categories_cache is not None:
-            categories = st.session_state.categories_cache
+        if categories_cache is not None:
+            categories = categories_cache
 
             if len(categories) > 0:
                 with st.form("update_category_form"):
                     # Select category to edit
                     categories_data = []
                     for category in categories:
-                        attrs = category.get('attributes', {})
+                        attrs = category.get('attributes') or {}
                         categories_data.append({
                             'ID': category.get('id'),
                             'Name': attrs.get('name', 'N/A')
                         })
 
+                    id_to_name = {c['ID']: c['Name'] for c in categories_data}
+                    categories_by_id = {c.get('id'): c for c in categories}
+
                     selected_category_id = st.selectbox(
                         "Select category to edit",
                         options=[c['ID'] for c in categories_data],
-                        format_func=lambda x: f"ID {x}: {next((c['Name'] for c in categories_data if c['ID'] == x), 'N/A')}"
+                        format_func=lambda x: f"ID {x}: {id_to_name.get(x, 'N/A')}"
                     )
 
                     # Get selected category details
-                    selected_category = next((c for c in categories if c.get('id') == selected_category_id), None)
+                    selected_category = categories_by_id.get(selected_category_id)
                     if selected_category:
                         attrs = selected_category.get('attributes', {})
 
@@ -395,21 +427,25 @@ else:
                                         with st.expander("View Updated Category", expanded=True):
                                             st.json(updated_category)
 
-                                        # Clear cache to force refresh
-                                        st.session_state.categories_cache = None
-                                        st.info("💡 Refresh the categories list in the 'View & Export Categories' tab to see the changes")
+                                        # Clear cache so the next run re-fetches
+                                        get_categories.clear()
+                                        st.info("💡 The categories list will show the changes on the next refresh")
                                     else:
                                         st.error(f"❌ {message}")
 
     # TAB 3: Delete Categories
-    with tab3:
+    @st.fragment
+    def delete_tab():
+        """Render the delete tab"""
+        categories_cache, _, _ = load_categories()
+
         st.subheader("Delete Categories")
         st.warning("⚠️ **Warning:** Deleting categories is permanent and cannot be undone!")
 
-        if st.session_state.categories_cache is None:
-            st.info("Please refresh categories in the 'View & Export Categories' tab first")
+        if categories_cache is None:
+            st.info("Categories could not be loaded. See the 'View & Export Categories' tab for details.")
         else:
-            categories = st.session_state.categories_cache
+            categories = categories_cache
 
             if len(categories) == 0:
                 st.info("No categories to delete")
@@ -419,20 +455,24 @@ else:
 
                 categories_data = []
                 for category in categories:
-                    attrs = category.get('attributes', {})
+                    attrs = category.get('attributes') or {}
+                    notes = attrs.get('notes') or ''
                     categories_data.append({
                         'ID': category.get('id'),
                         'Name': attrs.get('name', 'N/A'),
-                        'Notes': attrs.get('notes', '')[:50] if attrs.get('notes') else ''
+                        'Notes': notes[:50]
                     })
 
                 df = pd.DataFrame(categories_data)
 
+                id_to_name = {c['ID']: c['Name'] for c in categories_data}
+                categories_by_id = {c.get('id'): c for c in categories}
+
                 # Multi-select with checkboxes
                 selected_for_deletion = st.multiselect(
                     "Choose categories to delete",
                     options=[c['ID'] for c in categories_data],
-                    format_func=lambda x: f"ID {x}: {next((c['Name'] for c in categories_data if c['ID'] == x), 'N/A')}"
+                    format_func=lambda x: f"ID {x}: {id_to_name.get(x, 'N/A')}"
                 )
 
                 if selected_for_deletion:
@@ -446,7 +486,7 @@ else:
                     st.markdown("**Review Category Details Before Deletion:**")
 
                     for category_id in selected_for_deletion:
-                        category = next((c for c in categories if c.get('id') == category_id), None)
+                        category = categories_by_id.get(category_id)
                         if category:
                             attrs = category.get('attributes', {})
 
@@ -488,9 +528,16 @@ else:
                             progress_bar = st.progress(0)
                             status_text = st.empty()
 
+                            # Only update the UI when the whole percentage changes; each update is a message to the browser
+                            total = len(selected_for_deletion)
+                            last_pct = -1
+
                             for i, category_id in enumerate(selected_for_deletion):
-                                status_text.text(f"Deleting category {i+1}/{len(selected_for_deletion)}...")
-                                progress_bar.progress((i + 1) / len(selected_for_deletion))
+                                pct = (i + 1) * 100 // total
+                                if pct != last_pct:
+                                    status_text.text(f"Deleting category {i+1}/{total}...")
+                                    progress_bar.progress(pct / 100)
+                                    last_pct = pct
 
                                 success, message = client.delete_category(category_id)
                                 if success:
@@ -508,15 +555,16 @@ else:
                             if failed_count > 0:
                                 st.error(f"❌ Failed to delete {failed_count} category(ies)")
                                 with st.expander("View Errors"):
-                                    for error in error_messages:
-                                        st.text(error)
+                                    st.code("\n".join(error_messages), language=None)
 
-                            # Clear cache to force refresh
-                            st.session_state.categories_cache = None
-                            st.info("Please refresh the categories list in the 'View & Export Categories' tab")
+                            # Clear cache so the next run re-fetches
+                            get_categories.clear()
+                            st.info("The categories list will reflect the deletions on the next refresh")
 
     # TAB 4: Import Categories
-    with tab4:
+    @st.fragment
+    def import_tab():
+        """Render the import tab"""
         st.subheader("Import Categories")
         st.markdown("Upload a JSON file to import categories into Firefly III")
 
@@ -528,12 +576,15 @@ else:
 
         if uploaded_file is not None:
             try:
-                # Read the uploaded file
-                file_content = uploaded_file.read().decode('utf-8')
-                data = json.loads(file_content)
+                raw = uploaded_file.getvalue()
+
+                # Parse the uploaded bytes directly to avoid a decoded copy
+                data = orjson.loads(raw) if raw.strip() else None
 
                 # Validate the file structure
-                if not isinstance(data, dict) or 'categories' not in data:
+                if data is None:
+                    st.warning("The uploaded file is empty")
+                elif not isinstance(data, dict) or 'categories' not in data:
                     st.error("Invalid JSON file format. Expected 'categories' key.")
                 else:
                     categories_to_import = data.get('categories', [])
@@ -542,6 +593,8 @@ else:
                         st.error("Invalid categories format. Expected a list.")
                     elif len(categories_to_import) == 0:
                         st.warning("No categories found in the uploaded file")
+                    elif not all(isinstance(c, dict) for c in categories_to_import):
+                        st.error("Invalid categories format. Expected a list of category objects.")
                     else:
                         st.success(f"✅ Loaded {len(categories_to_import)} category(ies) from file")
 
@@ -554,7 +607,7 @@ else:
 
                         preview_data = []
                         for category in categories_to_import:
-                            attrs = category.get('attributes', {})
+                            attrs = category.get('attributes') or {}
                             notes = attrs.get('notes') or ''
                             notes_display = notes[:50] + '...' if len(notes) > 50 else notes
                             preview_data.append({
@@ -599,50 +652,70 @@ else:
                                         else:
                                             st.warning("Could not fetch existing categories. Proceeding without duplicate check.")
 
-                                existing_names = [
-                                    c.get('attributes', {}).get('name', '')
+                                # Case-insensitive name set for O(1) duplicate checks
+                                existing_names = {
+                                    (c.get('attributes', {}).get('name') or '').casefold()
                                     for c in existing_categories
-                                ]
+                                }
 
                                 success_count = 0
                                 skipped_count = 0
                                 failed_count = 0
                                 error_messages = []
 
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-
-                                for i, category in enumerate(categories_to_import):
-                                    attrs = category.get('attributes', {})
-                                    category_name = attrs.get('name', 'Untitled')
+                                # Prepare payloads, skipping duplicates up front
+                                to_import = []
+                                for category in categories_to_import:
+                                    attrs = category.get('attributes') or {}
+                                    name = attrs.get('name')
+                                    category_name = name or 'Untitled'
+                                    name_key = category_name.casefold()
 
-                                    status_text.text(f"Importing category {i+1}/{len(categories_to_import)}: {category_name}")
-                                    progress_bar.progress((i + 1) / len(categories_to_import))
+                                    # Validate locally instead of spending a request the API will reject
+                                    if not name:
+                                        failed_count += 1
+                                        error_messages.append(f"{category_name}: missing required field 'name'")
+                                        continue
 
-                                    # Check for duplicates
-                                    if skip_existing and category_name in existing_names:
+                                    # Check for duplicates before preparing the payload. Repeats
+                                    # within the file are always dropped (the API would reject them);
+                                    # existing_names only holds server names when skip_existing is set
+                                    if name_key in existing_names:
                                         skipped_count += 1
                                         continue
+                                    existing_names.add(name_key)
 
                                     # Clean and prepare category data for import
                                     clean_attrs = {
-                                        'name': attrs.get('name')
+                                        'name': name
                                     }
 
                                     # Add notes if present
-                                    if attrs.get('notes'):
-                                        clean_attrs['notes'] = attrs.get('notes')
+                                    notes = attrs.get('notes')
+                                    if notes:
+                                        clean_attrs['notes'] = notes
+
+                                    to_import.append((category_name, clean_attrs))
+
+                                # Show debug info if enabled
+                                if show_debug and to_import:  # Show only for first category to avoid clutter
+                                    category_name, import_category_data = to_import[0]
+                                    with st.expander(f"Debug: API Payload for '{category_name}'", expanded=True):
+                                        st.json(import_category_data)
+
+                                progress_bar = st.progress(0)
+                                status_text = st.empty()
 
-                                    # Prepare category data for import
-                                    import_category_data = clean_attrs
+                                # Only update the UI when the whole percentage changes; each update is a message to the browser
+                                total = len(to_import)
+                                last_pct = -1
 
-                                    # Show debug info if enabled
-                                    if show_debug and i == 0:  # Show only for first category to avoid clutter
-                                        with st.expander(f"Debug: API Payload for '{category_name}'", expanded=True):
-                                            st.json(import_category_data)
+                                # Create categories concurrently; results are consumed on this
+                                # thread so Streamlit calls never happen from worker threads
+                                results = client.create_categories([data for _, data in to_import])
 
-                                    # Create category
-                                    success, created_category, message = client.create_category(import_category_data)
+                                for i, (index, (success, created_category, message)) in enumerate(results):
+                                    category_name = to_import[index][0]
 
                                     if success:
                                         success_count += 1
@@ -650,19 +723,22 @@ else:
                                         failed_count += 1
                                         error_messages.append(f"{category_name}: {message}")
 
+                                    pct = (i + 1) * 100 // total
+                                    if pct != last_pct:
+                                        status_text.text(f"Imported category {i+1}/{total}: {category_name}")
+                                        progress_bar.progress(pct / 100)
+                                        last_pct = pct
+
                                 status_text.empty()
                                 progress_bar.empty()
 
                                 # Show results
                                 st.markdown("### Import Results")
-
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Imported", success_count)
-                                with col2:
-                                    st.metric("Skipped", skipped_count)
-                                with col3:
-                                    st.metric("Failed", failed_count)
+                                st.markdown(
+                                    "| Imported | Skipped | Failed |\n"
+                                    "|---|---|---|\n"
+                                    f"| {success_count} | {skipped_count} | {failed_count} |"
+                                )
 
                                 if success_count > 0:
                                     st.success(f"✅ Successfully imported {success_count} category(ies)")
@@ -673,18 +749,34 @@ else:
                                 if failed_count > 0:
                                     st.error(f"❌ Failed to import {failed_count} category(ies)")
                                     with st.expander("View Errors"):
-                                        for error in error_messages:
-                                            st.text(error)
+                                        st.code("\n".join(error_messages), language=None)
 
-                                # Clear cache to force refresh
-                                st.session_state.categories_cache = None
-                                st.info("Please refresh the categories list in the 'View & Export Categories' tab to see imported categories")
+                                # Clear cache so the next run re-fetches
+                                get_categories.clear()
+                                st.info("The categories list will include the imported categories on the next refresh")
 
-            except json.JSONDecodeError as e:
+            except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
                 st.error(f"Invalid JSON file: {str(e)}")
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
 
+    # Create tabs for different operations
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📋 View & Export Categories",
+        "➕ Create Category",
+        "🗑️ Delete Categories",
+        "📥 Import Categories"
+    ])
+
+    with tab1:
+        view_export_tab()
+    with tab2:
+        create_tab()
+    with tab3:
+        delete_tab()
+    with tab4:
+        import_tab()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.caption("Category Management for Firefly III")
@@ -5,7 +5,10 @@ Export, view, create, update, delete, and import revenue accounts
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+from datetime import datetime
+import orjson
 from pathlib import Path
 import sys
 
@@ -32,17 +35,167 @@ st.markdown("Manage your Firefly III revenue accounts: export, view, create, upd
 ACCOUNT_TYPE = "revenue"
 ACCOUNT_TYPE_DISPLAY = "Revenue"
 
-# Initialize session state for API connection
-if 'api_connected' not in st.session_state:
-    st.session_state.api_connected = False
-if 'firefly_url' not in st.session_state:
-    st.session_state.firefly_url = get_firefly_url()
-if 'firefly_token' not in st.session_state:
-    st.session_state.firefly_token = get_firefly_token()
-if 'revenue_accounts_cache' not in st.session_state:
-    st.session_state.revenue_accounts_cache = None
-if 'last_refresh_revenue' not in st.session_state:
-    st.session_state.last_refresh_revenue = None
+# Currencies offered in the create/edit forms
+CURRENCIES = ("EUR", "USD", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR")
+CURRENCY_INDEX = {code: i for i, code in enumerate(CURRENCIES)}
+
+# Imports up to this size check for duplicates by name search instead of fetching every account
+NAME_LOOKUP_LIMIT = 20
+
+# Per-refresh builds kept in the process-wide st.cache_data store; their keys change on
+# every refresh, create and update, so older entries must be evicted rather than kept forever
+ACCOUNT_CACHE_MAX_ENTRIES = 4
+
+# Display settings for the accounts table (Balance is numeric, _name_lower is search-only)
+ACCOUNT_TABLE_COLUMN_CONFIG = {
+    'Balance': st.column_config.NumberColumn('Balance', format="%.2f"),
+    '_name_lower': None
+}
+
+# Flattened API fields used to build the accounts table
+ACCOUNT_TABLE_FIELDS = [
+    'id',
+    'attributes.name',
+    'attributes.active',
+    'attributes.currency_code',
+    'attributes.current_balance',
+    'attributes.notes',
+    'attributes.created_at',
+    'attributes.updated_at'
+]
+
+
+@st.cache_data(show_spinner=False, max_entries=ACCOUNT_CACHE_MAX_ENTRIES)
+def accounts_to_df(refresh_key, _accounts):
+    """Build the accounts table, cached per refresh so widget reruns skip the rebuild"""
+    # Flatten the nested API objects in one call and derive the display columns vectorized
+    raw = pd.json_normalize(_accounts).reindex(columns=ACCOUNT_TABLE_FIELDS)
+
+    currency_code = raw['attributes.currency_code'].fillna('EUR').replace('', 'EUR')
+    current_balance = pd.to_numeric(raw['attributes.current_balance'], errors='coerce').fillna(0.0)
+
+    notes = raw['attributes.notes'].fillna('')
+    notes_display = notes.where(notes.str.len() <= 50, notes.str.slice(0, 50) + '...')
+
+    created_at = raw['attributes.created_at'].fillna('').str.slice(0, 10).replace('', 'N/A')
+    updated_at = raw['attributes.updated_at'].fillna('').str.slice(0, 10).replace('', 'N/A')
+
+    name = raw['attributes.name'].fillna('N/A')
+
+    return pd.DataFrame({
+        'ID': raw['id'],
+        'Name': name,
+        'Active': pd.Categorical(
+            raw['attributes.active'].eq(False).map({False: '✅', True: '❌'}),
+            categories=['✅', '❌']
+        ),
+        'Currency': pd.Categorical(currency_code),
+        'Balance': current_balance,
+        'Notes': notes_display,
+        'Created': created_at,
+        'Updated': updated_at,
+        '_name_lower': name.str.lower()  # hidden, pre-folded for the name search
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=ACCOUNT_CACHE_MAX_ENTRIES)
+def build_export_json(refresh_key, _accounts):
+    """Serialize the accounts export once per refresh, dated to when the accounts were fetched"""
+    export_data = {
+        'export_date': refresh_key.isoformat(),
+        'firefly_iii_accounts_export': True,
+        'account_type': ACCOUNT_TYPE,
+        'total_accounts': len(_accounts),
+        'accounts': _accounts
+    }
+    return orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+@st.fragment
+def render_accounts_table(df):
+    """Render the filters and accounts table; typing in the search reruns only this fragment"""
+    st.markdown("**Filter Accounts**")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        search_term = st.text_input("Search by name", "")
+
+    with col2:
+        status_filter = st.selectbox("Status", ["All", "Active Only", "Inactive Only"])
+
+    # Apply filters as one combined mask, slicing the table once
+    mask = np.ones(len(df), dtype=bool)
+
+    search_term = search_term.strip().lower()
+    if search_term:
+        mask &= df['_name_lower'].str.contains(search_term, regex=False, na=False).to_numpy()
+
+    if status_filter == "Active Only":
+        mask &= (df['Active'] == '✅').to_numpy()
+    elif status_filter == "Inactive Only":
+        mask &= (df['Active'] == '❌').to_numpy()
+
+    filtered_df = df[mask]
+
+    st.markdown(f"**Accounts List** ({len(filtered_df)} accounts)")
+    if len(filtered_df) == 0:
+        st.info("No accounts match your filters")
+    else:
+        st.dataframe(
+            filtered_df,
+            width='stretch',
+            height=400,
+            column_config=ACCOUNT_TABLE_COLUMN_CONFIG
+        )
+
+
+def build_import_payload(attrs):
+    """Build the create-account payload from an imported account's attributes"""
+    payload = {
+        'name': attrs.get('name'),
+        'type': ACCOUNT_TYPE,  # Force the type to match this page
+        'currency_code': attrs.get('currency_code', 'EUR'),
+        'active': attrs.get('active', True),
+        'include_net_worth': attrs.get('include_net_worth', False)
+    }
+
+    # Add optional fields
+    iban = attrs.get('iban')
+    if iban:
+        payload['iban'] = iban
+
+    notes = attrs.get('notes')
+    if notes:
+        payload['notes'] = notes
+
+    return payload
+
+
+def get_account_index(accounts):
+    """Index accounts and names by ID, rebuilt only when the cache is refreshed"""
+    refresh_key = st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE)
+    if st.session_state.revenue_accounts_index_key != refresh_key:
+        # Names come from the cached table rather than another pass over the raw accounts
+        names = accounts_to_df(refresh_key, accounts)[['ID', 'Name']]
+        st.session_state.revenue_accounts_by_id = {a.get('id'): a for a in accounts}
+        st.session_state.revenue_name_by_id = dict(zip(names['ID'], names['Name']))
+        st.session_state.revenue_accounts_index_key = refresh_key
+    return st.session_state.revenue_accounts_by_id, st.session_state.revenue_name_by_id
+
+
+# Initialize session state for API connection and the accounts cache
+for key, default in {
+    'api_connected': False,
+    'firefly_url': get_firefly_url(),
+    'firefly_token': get_firefly_token(),
+    'accounts_cache': {},
+    'accounts_refresh_ts': {},
+    'accounts_fetched_at': {},
+    'accounts_etag': {},
+    'revenue_accounts_index_key': None,
+    'revenue_export_filename_default': None
+}.items():
+    st.session_state.setdefault(key, default)
 
 # Auto-connect if credentials are available
 if not st.session_state.api_connected and st.session_state.firefly_url and st.session_state.firefly_token:
@@ -101,20 +254,31 @@ else:
         with col1:
             if st.button(f"🔄 Refresh {ACCOUNT_TYPE_DISPLAY} Accounts", type="primary"):
                 with st.spinner(f"Fetching {ACCOUNT_TYPE_DISPLAY.lower()} accounts from Firefly III..."):
-                    success, accounts, message = client.get_all_accounts(account_type=ACCOUNT_TYPE)
+                    # Only revalidate with the stored ETag while the cached list is still there
+                    cached_etag = None
+                    if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is not None:
+                        cached_etag = st.session_state.accounts_etag.get(ACCOUNT_TYPE)
+
+                    success, accounts, message = client.get_all_accounts(account_type=ACCOUNT_TYPE, etag=cached_etag)
                     if success:
-                        st.session_state.revenue_accounts_cache = accounts
-                        st.session_state.last_refresh_revenue = pd.Timestamp.now()
+                        # On 304 Not Modified the cached list and its table/export caches stay valid
+                        fetched_at = pd.Timestamp.now()
+                        if accounts is not None:
+                            st.session_state.accounts_cache[ACCOUNT_TYPE] = accounts
+                            st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = fetched_at
+                        # The refresh timestamp keys the caches; the displayed time tracks every fetch
+                        st.session_state.accounts_fetched_at[ACCOUNT_TYPE] = fetched_at
+                        st.session_state.accounts_etag[ACCOUNT_TYPE] = client.last_accounts_etag
                         st.success(message)
                     else:
                         st.error(message)
 
         with col2:
-            if st.session_state.last_refresh_revenue:
-                st.caption(f"Last refresh: {st.session_state.last_refresh_revenue.strftime('%H:%M:%S')}")
+            if st.session_state.accounts_fetched_at.get(ACCOUNT_TYPE):
+                st.caption(f"Last refresh: {st.session_state.accounts_fetched_at.get(ACCOUNT_TYPE).strftime('%H:%M:%S')}")
 
-        if st.session_state.revenue_accounts_cache is not None:
-            accounts = st.session_state.revenue_accounts_cache
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is not None:
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) == 0:
                 st.info(f"No {ACCOUNT_TYPE_DISPLAY.lower()} accounts found in your Firefly III instance")
@@ -132,68 +296,22 @@ else:
                     st.metric("Inactive", inactive_count)
 
                 # Convert accounts to DataFrame for display
-                accounts_data = []
-                for account in accounts:
-                    attrs = account.get('attributes', {})
-
-                    # Get current balance
-                    current_balance = attrs.get('current_balance') or '0'
-                    currency_code = attrs.get('currency_code') or 'EUR'
-
-                    notes = attrs.get('notes') or ''
-                    notes_display = notes[:50] + '...' if len(notes) > 50 else notes
+                df = accounts_to_df(st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE), accounts)
+                accounts_by_id, name_by_id = get_account_index(accounts)
 
-                    created_at = attrs.get('created_at') or 'N/A'
-                    updated_at = attrs.get('updated_at') or 'N/A'
-
-                    accounts_data.append({
-                        'ID': account.get('id'),
-                        'Name': attrs.get('name', 'N/A'),
-                        'Active': '✅' if attrs.get('active', True) else '❌',
-                        'Balance': f"{currency_code} {float(current_balance):,.2f}",
-                        'Notes': notes_display,
-                        'Created': created_at[:10] if created_at != 'N/A' else 'N/A',
-                        'Updated': updated_at[:10] if updated_at != 'N/A' else 'N/A'
-                    })
-
-                df = pd.DataFrame(accounts_data)
-
-                # Filter options
-                st.markdown("**Filter Accounts**")
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    search_term = st.text_input("Search by name", "")
-
-                with col2:
-                    status_filter = st.selectbox("Status", ["All", "Active Only", "Inactive Only"])
-
-                # Apply filters
-                filtered_df = df.copy()
-
-                if search_term:
-                    filtered_df = filtered_df[
-                        filtered_df['Name'].str.contains(search_term, case=False, na=False)
-                    ]
-
-                if status_filter == "Active Only":
-                    filtered_df = filtered_df[filtered_df['Active'] == '✅']
-                elif status_filter == "Inactive Only":
-                    filtered_df = filtered_df[filtered_df['Active'] == '❌']
-
-                st.markdown(f"**Accounts List** ({len(filtered_df)} accounts)")
-                st.dataframe(filtered_df, width='stretch', height=400)
+                # Filter options and accounts table
+                render_accounts_table(df)
 
                 # Expandable details for each account
                 with st.expander("📄 View Detailed Account Information"):
                     selected_account_id = st.selectbox(
                         "Select an account to view details",
-                        options=[a['ID'] for a in accounts_data],
-                        format_func=lambda x: f"ID {x}: {next((a['Name'] for a in accounts_data if a['ID'] == x), 'N/A')}"
+                        options=list(name_by_id),
+                        format_func=lambda x: f"ID {x}: {name_by_id.get(x, 'N/A')}"
                     )
 
                     if selected_account_id:
-                        account = next((a for a in accounts if a.get('id') == selected_account_id), None)
+                        account = accounts_by_id.get(selected_account_id)
                         if account:
                             attrs = account.get('attributes', {})
 
@@ -231,9 +349,14 @@ else:
                 col1, col2 = st.columns([2, 1])
 
                 with col1:
+                    # Stamp the default filename once, not on every rerun
+                    if st.session_state.revenue_export_filename_default is None:
+                        st.session_state.revenue_export_filename_default = (
+                            f"firefly_{ACCOUNT_TYPE}_accounts_export_{datetime.now():%Y%m%d_%H%M%S}.json"
+                        )
                     export_filename = st.text_input(
                         "Export filename",
-                        value=f"firefly_{ACCOUNT_TYPE}_accounts_export_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json"
+                        value=st.session_state.revenue_export_filename_default
                     )
 
                 with col2:
@@ -241,28 +364,22 @@ else:
                     st.markdown("")  # Spacing
 
                     if st.button(f"💾 Export All {ACCOUNT_TYPE_DISPLAY} Accounts", type="primary"):
-                        # Create export data
-                        export_data = {
-                            'export_date': pd.Timestamp.now().isoformat(),
-                            'firefly_iii_accounts_export': True,
-                            'account_type': ACCOUNT_TYPE,
-                            'total_accounts': len(accounts),
-                            'accounts': accounts
-                        }
-
-                        # Convert to JSON string
-                        json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
+                        # Build (or reuse) the serialized export for this refresh
+                        json_bytes = build_export_json(st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE), accounts)
 
                         # Offer download
                         st.download_button(
                             label="⬇️ Download JSON",
-                            data=json_str,
+                            data=json_bytes,
                             file_name=export_filename,
                             mime="application/json"
                         )
 
                         st.success(f"✅ Prepared {len(accounts)} {ACCOUNT_TYPE_DISPLAY.lower()} accounts for export")
 
+                        # Give the next export a fresh timestamped default
+                        st.session_state.revenue_export_filename_default = None
+
     # TAB 2: Create Account
     with tab2:
         st.subheader(f"Create New {ACCOUNT_TYPE_DISPLAY} Account")
@@ -278,7 +395,7 @@ else:
 
             account_currency = st.selectbox(
                 "Currency *",
-                options=["EUR", "USD", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR"],
+                options=CURRENCIES,
                 help="Required. The currency for this account."
             )
 
@@ -338,9 +455,13 @@ else:
                             with st.expander("View Created Account", expanded=True):
                                 st.json(created_account)
 
-                            # Clear cache to force refresh
-                            st.session_state.revenue_accounts_cache = None
-                            st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the new account")
+                            # Add the new account to the cached list instead of forcing a re-fetch
+                            cached_accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
+                            if cached_accounts is not None:
+                                cached_accounts.append(created_account)
+                                st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = pd.Timestamp.now()
+                            else:
+                                st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the new account")
                         else:
                             st.error(f"❌ {message}")
 
@@ -348,28 +469,22 @@ else:
         st.markdown("### Edit Existing Account")
         st.markdown("To edit an account, first refresh the accounts list in the 'View & Export Accounts' tab.")
 
-        if st.session_state.revenue_accounts_cache is not None:
-            accounts = st.session_state.revenue_accounts_cache
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is not None:
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) > 0:
                 with st.form("update_account_form"):
                     # Select account to edit
-                    accounts_data = []
-                    for account in accounts:
-                        attrs = account.get('attributes', {})
-                        accounts_data.append({
-                            'ID': account.get('id'),
-                            'Name': attrs.get('name', 'N/A')
-                        })
+                    accounts_by_id, name_by_id = get_account_index(accounts)
 
                     selected_account_id = st.selectbox(
                         "Select account to edit",
-                        options=[a['ID'] for a in accounts_data],
-                        format_func=lambda x: f"ID {x}: {next((a['Name'] for a in accounts_data if a['ID'] == x), 'N/A')}"
+                        options=list(name_by_id),
+                        format_func=lambda x: f"ID {x}: {name_by_id.get(x, 'N/A')}"
                     )
 
                     # Get selected account details
-                    selected_account = next((a for a in accounts if a.get('id') == selected_account_id), None)
+                    selected_account = accounts_by_id.get(selected_account_id)
                     if selected_account:
                         attrs = selected_account.get('attributes', {})
 
@@ -383,8 +498,8 @@ else:
 
                         new_currency = st.selectbox(
                             "Currency *",
-                            options=["EUR", "USD", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR"],
-                            index=["EUR", "USD", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR"].index(attrs.get('currency_code', 'EUR')) if attrs.get('currency_code', 'EUR') in ["EUR", "USD", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR"] else 0,
+                            options=CURRENCIES,
+                            index=CURRENCY_INDEX.get(attrs.get('currency_code', 'EUR'), 0),
                             help="Required. The currency for this account."
                         )
 
@@ -451,9 +566,12 @@ else:
                                         with st.expander("View Updated Account", expanded=True):
                                             st.json(updated_account)
 
-                                        # Clear cache to force refresh
-                                        st.session_state.revenue_accounts_cache = None
-                                        st.info("💡 Refresh the accounts list in the 'View & Export Accounts' tab to see the changes")
+                                        # Swap the updated account into the cached list instead of forcing a re-fetch
+                                        accounts[:] = [
+                                            updated_account if a.get('id') == selected_account_id else a
+                                            for a in accounts
+                                        ]
+                                        st.session_state.accounts_refresh_ts[ACCOUNT_TYPE] = pd.Timestamp.now()
                                     else:
                                         st.error(f"❌ {message}")
 
@@ -462,10 +580,10 @@ else:
         st.subheader(f"Delete {ACCOUNT_TYPE_DISPLAY} Accounts")
         st.warning("⚠️ **Warning:** Deleting accounts is permanent and cannot be undone!")
 
-        if st.session_state.revenue_accounts_cache is None:
+        if st.session_state.accounts_cache.get(ACCOUNT_TYPE) is None:
             st.info("Please refresh accounts in the 'View & Export Accounts' tab first")
         else:
-            accounts = st.session_state.revenue_accounts_cache
+            accounts = st.session_state.accounts_cache.get(ACCOUNT_TYPE)
 
             if len(accounts) == 0:
                 st.info(f"No {ACCOUNT_TYPE_DISPLAY.lower()} accounts to delete")
@@ -473,37 +591,37 @@ else:
                 # Select accounts to delete
                 st.markdown("**Select accounts to delete:**")
 
-                accounts_data = []
-                for account in accounts:
-                    attrs = account.get('attributes', {})
-                    accounts_data.append({
-                        'ID': account.get('id'),
-                        'Name': attrs.get('name', 'N/A'),
-                        'Active': '✅' if attrs.get('active', True) else '❌',
-                        'Balance': f"{attrs.get('currency_code', 'EUR')} {float(attrs.get('current_balance', '0')):,.2f}"
-                    })
-
-                df = pd.DataFrame(accounts_data)
+                df = accounts_to_df(st.session_state.accounts_refresh_ts.get(ACCOUNT_TYPE), accounts)[['ID', 'Name', 'Active', 'Currency', 'Balance']]
+                accounts_by_id, name_by_id = get_account_index(accounts)
 
                 # Multi-select with checkboxes
                 selected_for_deletion = st.multiselect(
                     "Choose accounts to delete",
-                    options=[a['ID'] for a in accounts_data],
-                    format_func=lambda x: f"ID {x}: {next((a['Name'] for a in accounts_data if a['ID'] == x), 'N/A')}"
+                    options=list(name_by_id),
+                    format_func=lambda x: f"ID {x}: {name_by_id.get(x, 'N/A')}"
                 )
 
                 if selected_for_deletion:
                     st.markdown(f"**Selected {len(selected_for_deletion)} account(s) for deletion:**")
 
                     deletion_preview = df[df['ID'].isin(selected_for_deletion)]
-                    st.dataframe(deletion_preview, width='stretch')
+                    st.dataframe(deletion_preview, width='stretch', column_config=ACCOUNT_TABLE_COLUMN_CONFIG)
 
                     # Show detailed information for each selected account
                     st.markdown("---")
                     st.markdown("**Review Account Details Before Deletion:**")
 
-                    for account_id in selected_for_deletion:
-                        account = next((a for a in accounts if a.get('id') == account_id), None)
+                    # Only build expanders for the first N selections; the preview table covers the rest
+                    details_limit = st.number_input(
+                        "Show details for first N",
+                        min_value=1,
+                        max_value=len(selected_for_deletion),
+                        value=min(10, len(selected_for_deletion))
+                    )
+                    show_all_raw_json = st.checkbox("🔍 Show raw JSON for all", key="delete_json_all")
+
+                    for account_id in selected_for_deletion[:details_limit]:
+                        account = accounts_by_id.get(account_id)
                         if account:
                             attrs = account.get('attributes', {})
 
@@ -529,9 +647,8 @@ else:
                                         st.markdown("*No notes*")
 
                                 # Show raw JSON
-                                st.markdown("---")
-                                show_raw_json = st.checkbox("🔍 Show Raw JSON", key=f"delete_json_{account_id}")
-                                if show_raw_json:
+                                if show_all_raw_json:
+                                    st.markdown("---")
                                     st.json(account)
 
                     st.markdown("---")
@@ -549,11 +666,12 @@ else:
                             progress_bar = st.progress(0)
                             status_text = st.empty()
 
-                            for i, account_id in enumerate(selected_for_deletion):
-                                status_text.text(f"Deleting account {i+1}/{len(selected_for_deletion)}...")
+                            # Deletes run concurrently; progress advances as each one completes
+                            deletions = client.delete_accounts(selected_for_deletion)
+                            for i, (account_id, (success, message)) in enumerate(deletions):
+                                status_text.text(f"Deleted account {i+1}/{len(selected_for_deletion)}...")
                                 progress_bar.progress((i + 1) / len(selected_for_deletion))
 
-                                success, message = client.delete_account(account_id)
                                 if success:
                                     success_count += 1
                                 else:
@@ -573,7 +691,7 @@ else:
                                         st.text(error)
 
                             # Clear cache to force refresh
-                            st.session_state.revenue_accounts_cache = None
+                            st.session_state.accounts_cache.pop(ACCOUNT_TYPE, None)
                             st.info("Please refresh the accounts list in the 'View & Export Accounts' tab")
 
     # TAB 4: Import Accounts
@@ -589,9 +707,8 @@ else:
 
         if uploaded_file is not None:
             try:
-                # Read the uploaded file
-                file_content = uploaded_file.read().decode('utf-8')
-                data = json.loads(file_content)
+                # Parse the uploaded bytes directly, without a decoded string copy
+                data = orjson.loads(uploaded_file.getvalue())
 
                 # Validate the file structure
                 if not isinstance(data, dict) or 'accounts' not in data:
@@ -618,20 +735,22 @@ else:
                         # Preview accounts
                         st.markdown("**Preview of accounts to import:**")
 
-                        preview_data = []
-                        for account in accounts_to_import:
-                            attrs = account.get('attributes', {})
-                            notes = attrs.get('notes') or ''
-                            notes_display = notes[:50] + '...' if len(notes) > 50 else notes
-                            preview_data.append({
-                                'Name': attrs.get('name', 'N/A'),
-                                'Type': attrs.get('type', 'N/A'),
-                                'Currency': attrs.get('currency_code', 'N/A'),
-                                'Active': '✅' if attrs.get('active', True) else '❌',
-                                'Notes': notes_display
-                            })
-
-                        preview_df = pd.DataFrame(preview_data)
+                        raw = pd.json_normalize(accounts_to_import).reindex(columns=[
+                            'attributes.name',
+                            'attributes.type',
+                            'attributes.currency_code',
+                            'attributes.active',
+                            'attributes.notes'
+                        ])
+                        notes = raw['attributes.notes'].fillna('')
+
+                        preview_df = pd.DataFrame({
+                            'Name': raw['attributes.name'].fillna('N/A'),
+                            'Type': raw['attributes.type'].fillna('N/A'),
+                            'Currency': raw['attributes.currency_code'].fillna('N/A'),
+                            'Active': raw['attributes.active'].eq(False).map({False: '✅', True: '❌'}),
+                            'Notes': notes.where(notes.str.len() <= 50, notes.str.slice(0, 50) + '...')
+                        })
                         st.dataframe(preview_df, width='stretch', height=300)
 
                         # Import options
@@ -660,7 +779,23 @@ else:
                             if st.button(f"📥 Import {ACCOUNT_TYPE_DISPLAY} Accounts", type="primary", disabled=not confirm_import):
                                 # Get existing accounts to check for duplicates
                                 existing_accounts = []
-                                if skip_existing:
+                                names_checked = False
+                                if skip_existing and len(accounts_to_import) <= NAME_LOOKUP_LIMIT:
+                                    # Few names to check: search for each instead of downloading every account
+                                    with st.spinner("Checking for existing accounts..."):
+                                        import_names = {
+                                            a.get('attributes', {}).get('name') for a in accounts_to_import
+                                        } - {None, ''}
+                                        names_checked = True
+                                        for name in import_names:
+                                            success, matches, message = client.search_accounts(name, account_type=ACCOUNT_TYPE)
+                                            if not success:
+                                                names_checked = False
+                                                existing_accounts = []
+                                                break
+                                            existing_accounts.extend(matches)
+
+                                if skip_existing and not names_checked:
                                     with st.spinner("Fetching existing accounts..."):
                                         success, existing_accounts_list, message = client.get_all_accounts(account_type=ACCOUNT_TYPE)
                                         if success:
@@ -668,57 +803,61 @@ else:
                                         else:
                                             st.warning("Could not fetch existing accounts. Proceeding without duplicate check.")
 
-                                existing_names = [
-                                    a.get('attributes', {}).get('name', '')
+                                # Case-insensitive name set for O(1) duplicate checks
+                                existing_names = {
+                                    (a.get('attributes', {}).get('name') or '').casefold()
                                     for a in existing_accounts
-                                ]
+                                }
 
                                 success_count = 0
-                                skipped_count = 0
                                 failed_count = 0
                                 error_messages = []
 
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-
-                                for i, account in enumerate(accounts_to_import):
-                                    attrs = account.get('attributes', {})
-                                    account_name = attrs.get('name', 'Untitled')
-
-                                    status_text.text(f"Importing account {i+1}/{len(accounts_to_import)}: {account_name}")
-                                    progress_bar.progress((i + 1) / len(accounts_to_import))
-
-                                    # Check for duplicates
-                                    if skip_existing and account_name in existing_names:
-                                        skipped_count += 1
+                                # Prepare payloads first; duplicates are skipped before any request is made
+                                import_attrs = [account.get('attributes', {}) for account in accounts_to_import]
+                                if skip_existing:
+                                    import_attrs = [
+                                        attrs for attrs in import_attrs
+                                        if (attrs.get('name') or '').casefold() not in existing_names
+                                    ]
+                                skipped_count = len(accounts_to_import) - len(import_attrs)
+
+                                # Repeated names within the file would only fail on the server's unique-name check
+                                seen_names = set()
+                                unique_attrs = []
+                                for attrs in import_attrs:
+                                    name_key = (attrs.get('name') or '').casefold()
+                                    if name_key and name_key in seen_names:
                                         continue
+                                    seen_names.add(name_key)
+                                    unique_attrs.append(attrs)
+                                duplicates_in_file = len(import_attrs) - len(unique_attrs)
+                                import_attrs = unique_attrs
+
+                                to_import = [
+                                    (attrs.get('name') or 'Untitled', build_import_payload(attrs))
+                                    for attrs in import_attrs
+                                ]
 
-                                    # Clean and prepare account data for import
-                                    clean_attrs = {
-                                        'name': attrs.get('name'),
-                                        'type': ACCOUNT_TYPE,  # Force the type to match this page
-                                        'currency_code': attrs.get('currency_code', 'EUR'),
-                                        'active': attrs.get('active', True),
-                                        'include_net_worth': attrs.get('include_net_worth', False)
-                                    }
-
-                                    # Add optional fields
-                                    if attrs.get('iban'):
-                                        clean_attrs['iban'] = attrs.get('iban')
+                                # Show debug info if enabled
+                                if show_debug and to_import:  # Show only for first account to avoid clutter
+                                    account_name, import_account_data = to_import[0]
+                                    with st.expander(f"Debug: API Payload for '{account_name}'", expanded=True):
+                                        st.json(import_account_data)
 
-                                    if attrs.get('notes'):
-                                        clean_attrs['notes'] = attrs.get('notes')
+                                progress_bar = st.progress(0)
+                                status_text = st.empty()
 
-                                    # Prepare account data for import
-                                    import_account_data = clean_attrs
+                                # Only update the UI when the whole percentage changes; each update is a message to the browser
+                                total = len(to_import)
+                                last_pct = -1
 
-                                    # Show debug info if enabled
-                                    if show_debug and i == 0:  # Show only for first account to avoid clutter
-                                        with st.expander(f"Debug: API Payload for '{account_name}'", expanded=True):
-                                            st.json(import_account_data)
+                                # Create accounts concurrently; results are consumed on this
+                                # thread so Streamlit calls never happen from worker threads
+                                results = client.create_accounts([data for _, data in to_import])
 
-                                    # Create account
-                                    success, created_account, message = client.create_account(import_account_data)
+                                for i, (index, (success, created_account, message)) in enumerate(results):
+                                    account_name = to_import[index][0]
 
                                     if success:
                                         success_count += 1
@@ -726,18 +865,26 @@ else:
                                         failed_count += 1
                                         error_messages.append(f"{account_name}: {message}")
 
+                                    pct = (i + 1) * 100 // total
+                                    if pct != last_pct:
+                                        status_text.text(f"Imported account {i+1}/{total}: {account_name}")
+                                        progress_bar.progress(pct / 100)
+                                        last_pct = pct
+
                                 status_text.empty()
                                 progress_bar.empty()
 
                                 # Show results
                                 st.markdown("### Import Results")
 
-                                col1, col2, col3 = st.columns(3)
+                                col1, col2, col3, col4 = st.columns(4)
                                 with col1:
                                     st.metric("Imported", success_count)
                                 with col2:
                                     st.metric("Skipped", skipped_count)
                                 with col3:
+                                    st.metric("Duplicates in File", duplicates_in_file)
+                                with col4:
                                     st.metric("Failed", failed_count)
 
                                 if success_count > 0:
@@ -746,6 +893,9 @@ else:
                                 if skipped_count > 0:
                                     st.info(f"ℹ️ Skipped {skipped_count} duplicate account(s)")
 
+                                if duplicates_in_file > 0:
+                                    st.info(f"ℹ️ Dropped {duplicates_in_file} repeated account name(s) within the file")
+
                                 if failed_count > 0:
                                     st.error(f"❌ Failed to import {failed_count} account(s)")
                                     with st.expander("View Errors"):
@@ -753,10 +903,10 @@ else:
                                             st.text(error)
 
                                 # Clear cache to force refresh
-                                st.session_state.revenue_accounts_cache = None
+                                st.session_state.accounts_cache.pop(ACCOUNT_TYPE, None)
                                 st.info("Please refresh the accounts list in the 'View & Export Accounts' tab to see imported accounts")
 
-            except json.JSONDecodeError as e:
+            except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
                 st.error(f"Invalid JSON file: {str(e)}")
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
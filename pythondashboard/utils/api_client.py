@@ -3,11 +3,65 @@
 This module provides a client for interacting with the Firefly III REST API.
 """
 
+import orjson
 import requests
 import pandas as pd
+import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date
 
+# Maximum number of pooled connections per host
+POOL_SIZE = 32
+
+# Maximum number of transaction pages fetched concurrently
+PAGE_WORKERS = 10
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_get_data(base_url: str, api_token: str, path: str, params: Tuple, _session: requests.Session) -> List[Dict]:
+    """
+    Fetch the 'data' list of a GET endpoint, memoized across Streamlit reruns.
+
+    The URL, token and params form the cache key; the session is not hashed.
+    """
+    response = _session.get(
+        f"{base_url}{path}",
+        params=dict(params),
+        timeout=10
+    )
+    response.raise_for_status()  # raising keeps failed responses out of the cache
+
+    return orjson.loads(response.content).get('data', [])
+
+
+# Column dtypes of parse_account_data
+ACCOUNT_DTYPES = {
+    'current_balance': 'float64',
+    'active': 'bool',
+    'include_net_worth': 'bool',
+    'type': 'category',
+    'account_role': 'category',
+    'currency_code': 'category'
+}
+
+# Values parse_transaction_data uses for fields a split does not have; fields
+# sent as null keep None (tags get a fresh empty list per split)
+SPLIT_DEFAULTS = {
+    'date': None,
+    'description': '',
+    'amount': 0,
+    'currency_code': 'EUR',
+    'type': '',
+    'category_name': '',
+    'budget_name': '',
+    'source_name': '',
+    'destination_name': '',
+    'notes': ''
+}
+
 
 class FireflyAPIClient:
     """Client for interacting with Firefly III API"""
@@ -28,6 +82,46 @@ class FireflyAPIClient:
             'Content-Type': 'application/json'
         }
 
+        # Keep connections alive across calls instead of a new TCP/TLS handshake per request;
+        # transient server errors and rate limiting are retried inside urllib3
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.25,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _get_data(self, path: str, params: Optional[Dict] = None) -> List[Dict]:
+        """
+        Fetch the 'data' list of a GET endpoint through the rerun cache.
+
+        Args:
+            path: API path (e.g., /api/v1/budgets)
+            params: Optional query parameters
+
+        Returns:
+            List of resource dictionaries, or an empty list on failure
+        """
+        try:
+            return _cached_get_data(
+                self.base_url,
+                self.api_token,
+                path,
+                tuple(sorted((params or {}).items())),
+                self.session
+            )
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return []
+
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test API connection.
@@ -36,18 +130,17 @@ class FireflyAPIClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/v1/about",
-                headers=self.headers,
                 timeout=10
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 version = data.get('data', {}).get('version', 'unknown')
                 return True, f"Connected to Firefly III v{version}"
             else:
                 return False, f"Error: {response.status_code} - {response.text}"
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             return False, f"Connection failed: {str(e)}"
 
     def get_accounts(self, account_type: Optional[str] = None) -> List[Dict]:
@@ -60,26 +153,11 @@ class FireflyAPIClient:
         Returns:
             List of account dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/accounts"
-            params = {}
-            if account_type:
-                params['type'] = account_type
-
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
+        params = {}
+        if account_type:
+            params['type'] = account_type
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            else:
-                return []
-        except requests.exceptions.RequestException:
-            return []
+        return self._get_data('/api/v1/accounts', params)
 
     def get_transactions(
         self,
@@ -111,43 +189,44 @@ class FireflyAPIClient:
             if transaction_type:
                 params['type'] = transaction_type
 
-            all_transactions = []
-            page = 1
-
-            while True:
-                params['page'] = page
-                response = requests.get(
+            def fetch_page(page: int) -> Dict:
+                response = self.session.get(
                     url,
-                    headers=self.headers,
-                    params=params,
+                    params={**params, 'page': page},
                     timeout=30
                 )
+                response.raise_for_status()
+                return orjson.loads(response.content)
 
-                if response.status_code != 200:
-                    break
-
-                data = response.json()
-                transactions = data.get('data', [])
+            # The first page reports how many pages there are
+            data = fetch_page(1)
 
-                if not transactions:
-                    break
+            all_transactions = list(data.get('data', []))
 
-                all_transactions.extend(transactions)
+            meta = data.get('meta') or {}
+            pagination = meta.get('pagination') or {}
+            total_pages = pagination.get('total_pages', 1)
 
-                # Check if there are more pages
-                meta = data.get('meta', {})
-                pagination = meta.get('pagination', {})
-                current_page = pagination.get('current_page', page)
-                total_pages = pagination.get('total_pages', page)
+            # Fetch the remaining pages concurrently; results come back in page order
+            if all_transactions and total_pages > 1:
+                remaining_pages = range(2, total_pages + 1)
+                with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(remaining_pages))) as executor:
+                    page_futures = [executor.submit(fetch_page, page) for page in remaining_pages]
 
-                if current_page >= total_pages:
-                    break
+                    for future in page_futures:
+                        try:
+                            page_data = future.result()
+                        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+                            # As before, stop at the first failed page and keep what was fetched
+                            for pending in page_futures:
+                                pending.cancel()
+                            break
 
-                page += 1
+                        all_transactions.extend(page_data.get('data', []))
 
             return all_transactions
 
-        except requests.exceptions.RequestException:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
             return []
 
     def get_budgets(self) -> List[Dict]:
@@ -157,20 +236,7 @@ class FireflyAPIClient:
         Returns:
             List of budget dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/budgets"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            return []
-        except requests.exceptions.RequestException:
-            return []
+        return self._get_data('/api/v1/budgets')
 
     def get_budget_limits(self, budget_id: str, start: str, end: str) -> List[Dict]:
         """
@@ -185,20 +251,14 @@ class FireflyAPIClient:
             List of budget limit dictionaries
         """
         try:
-            url = f"{self.base_url}/api/v1/budgets/{budget_id}/limits"
-            params = {'start': start, 'end': end}
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
+            response = self.session.get(
+                f"{self.base_url}/api/v1/budgets/{budget_id}/limits",
+                params={'start': start, 'end': end},
                 timeout=10
             )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            return []
-        except requests.exceptions.RequestException:
+            response.raise_for_status()
+            return orjson.loads(response.content).get('data', [])
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
             return []
 
     def get_categories(self) -> List[Dict]:
@@ -208,20 +268,7 @@ class FireflyAPIClient:
         Returns:
             List of category dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/categories"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            return []
-        except requests.exceptions.RequestException:
-            return []
+        return self._get_data('/api/v1/categories')
 
     def get_bills(self) -> List[Dict]:
         """
@@ -230,20 +277,7 @@ class FireflyAPIClient:
         Returns:
             List of bill dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/bills"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            return []
-        except requests.exceptions.RequestException:
-            return []
+        return self._get_data('/api/v1/bills')
 
     def get_piggy_banks(self) -> List[Dict]:
         """
@@ -252,20 +286,7 @@ class FireflyAPIClient:
         Returns:
             List of piggy bank dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/piggy-banks"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get('data', [])
-            return []
-        except requests.exceptions.RequestException:
-            return []
+        return self._get_data('/api/v1/piggy-banks')
 
     def parse_account_data(self, accounts_data: List[Dict]) -> pd.DataFrame:
         """
@@ -277,28 +298,25 @@ class FireflyAPIClient:
         Returns:
             DataFrame with parsed account data
         """
-        accounts = []
-
-        for account in accounts_data:
-            attributes = account.get('attributes', {})
+        attributes = [account.get('attributes', {}) for account in accounts_data]
+
+        # Build the columns as lists; pandas then has no per-row dicts to align
+        df = pd.DataFrame({
+            'id': [account.get('id') for account in accounts_data],
+            'name': [attrs.get('name', '') for attrs in attributes],
+            'type': [attrs.get('type', '') for attrs in attributes],
+            'account_role': [attrs.get('account_role', '') for attrs in attributes],
+            'currency_code': [attrs.get('currency_code', 'EUR') for attrs in attributes],
+            'current_balance': [attrs.get('current_balance', '0') for attrs in attributes],
+            'iban': [attrs.get('iban', '') for attrs in attributes],
+            'active': [attrs.get('active', True) for attrs in attributes],
+            'include_net_worth': [attrs.get('include_net_worth', True) for attrs in attributes]
+        })
+
+        # Numeric balance, boolean flags and categorical labels (see ACCOUNT_DTYPES)
+        df = df.astype(ACCOUNT_DTYPES)
 
-            # Get current balance
-            current_balance = attributes.get('current_balance', '0')
-            currency_code = attributes.get('currency_code', 'EUR')
-
-            accounts.append({
-                'id': account.get('id'),
-                'name': attributes.get('name', ''),
-                'type': attributes.get('type', ''),
-                'account_role': attributes.get('account_role', ''),
-                'currency_code': currency_code,
-                'current_balance': float(current_balance),
-                'iban': attributes.get('iban', ''),
-                'active': attributes.get('active', True),
-                'include_net_worth': attributes.get('include_net_worth', True)
-            })
-
-        return pd.DataFrame(accounts)
+        return df
 
     def parse_transaction_data(self, transactions_data: List[Dict]) -> pd.DataFrame:
         """
@@ -310,41 +328,69 @@ class FireflyAPIClient:
         Returns:
             DataFrame with parsed transaction data
         """
-        transactions = []
-
-        for transaction in transactions_data:
-            attributes = transaction.get('attributes', {})
-
-            # Each transaction can have multiple "splits" (for split transactions)
-            transaction_splits = attributes.get('transactions', [])
-
-            for split in transaction_splits:
-                transactions.append({
-                    'id': transaction.get('id'),
-                    'date': split.get('date'),
-                    'created_at': attributes.get('created_at'),
-                    'updated_at': attributes.get('updated_at'),
-                    'description': split.get('description', ''),
-                    'amount': float(split.get('amount', 0)),
-                    'currency_code': split.get('currency_code', 'EUR'),
-                    'type': split.get('type', ''),
-                    'category_name': split.get('category_name', ''),
-                    'budget_name': split.get('budget_name', ''),
-                    'source_name': split.get('source_name', ''),
-                    'destination_name': split.get('destination_name', ''),
-                    'notes': split.get('notes', ''),
-                    'tags': split.get('tags', []),
-                })
-
-        df = pd.DataFrame(transactions)
-
-        # Convert date columns to datetime
+        # json_normalize needs the record path on every item, so drop transactions without splits
+        transactions_data = [
+            t for t in transactions_data if t.get('attributes', {}).get('transactions')
+        ]
+        if not transactions_data:
+            return pd.DataFrame()
+
+        # Default only the fields a split lacks; a fillna afterwards would also
+        # overwrite explicit nulls, which pages later fill with 'Uncategorized'/'Unknown'
+        transactions_data = [
+            {
+                'id': t.get('id'),
+                'attributes': {
+                    'created_at': t['attributes'].get('created_at'),
+                    'updated_at': t['attributes'].get('updated_at'),
+                    'transactions': [
+                        {**SPLIT_DEFAULTS, 'tags': [], **split}
+                        for split in t['attributes']['transactions']
+                    ]
+                }
+            }
+            for t in transactions_data
+        ]
+
+        # Flatten every split in one pass; each transaction can have multiple
+        # "splits" (for split transactions), and each split becomes one row
+        raw = pd.json_normalize(
+            transactions_data,
+            record_path=['attributes', 'transactions'],
+            meta=['id', ['attributes', 'created_at'], ['attributes', 'updated_at']],
+            meta_prefix='meta.',
+            errors='ignore'
+        )
+
+        if raw.empty:
+            return pd.DataFrame()
+
+        df = pd.DataFrame({
+            'id': raw['meta.id'],
+            'date': raw['date'],
+            'created_at': raw['meta.attributes.created_at'],
+            'updated_at': raw['meta.attributes.updated_at'],
+            'description': raw['description'],
+            'amount': pd.to_numeric(raw['amount'], errors='coerce'),
+            'currency_code': raw['currency_code'],
+            'type': raw['type'],
+            'category_name': raw['category_name'],
+            'budget_name': raw['budget_name'],
+            'source_name': raw['source_name'],
+            'destination_name': raw['destination_name'],
+            'notes': raw['notes'],
+            'tags': raw['tags']
+        })
+        df['amount'] = df['amount'].astype(float)
+
+        # Convert date columns to datetime; the API sends ISO 8601 timestamps, and
+        # cache=True parses each distinct string once (many splits share a date)
         if not df.empty:
             if 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'], utc=True)
+                df['date'] = pd.to_datetime(df['date'], utc=True, format='ISO8601', cache=True)
             if 'created_at' in df.columns:
-                df['created_at'] = pd.to_datetime(df['created_at'], utc=True)
+                df['created_at'] = pd.to_datetime(df['created_at'], utc=True, format='ISO8601', cache=True)
             if 'updated_at' in df.columns:
-                df['updated_at'] = pd.to_datetime(df['updated_at'], utc=True)
+                df['updated_at'] = pd.to_datetime(df['updated_at'], utc=True, format='ISO8601', cache=True)
 
         return df
@@ -3,9 +3,163 @@
 Common financial calculations and data aggregations.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import BaseOffset, Day, MonthEnd, QuarterEnd, Week, YearEnd
+
+# Period frequencies used by get_date_ranges
+DATE_RANGE_FREQS = {'month': 'M', 'quarter': 'Q', 'year': 'Y'}
+
+# Empty results for calculators polled with no transactions; callers get
+# a shallow copy so adding display columns never touches the shared frame
+_EMPTY_CASH_FLOW = pd.DataFrame(columns=['period', 'income', 'expenses', 'net_flow'])
+_EMPTY_CATEGORY_SPENDING = pd.DataFrame(columns=['category_name', 'total_amount', 'transaction_count'])
+_EMPTY_INCOME_SOURCES = pd.DataFrame(columns=['source_name', 'total_amount', 'transaction_count'])
+
+# Open-ended bounds for _date_range_mask
+_MIN_DATE = pd.Timestamp.min.to_datetime64()
+_MAX_DATE = pd.Timestamp.max.to_datetime64()
+
+# Transaction type codes produced by _type_codes
+DEPOSIT, WITHDRAWAL, OTHER_TYPE = 0, 1, 2
+
+
+def _ensure_datetime(dates: pd.Series) -> pd.Series:
+    """
+    Return dates as timezone-naive datetimes, parsing only when needed.
+
+    Args:
+        dates: Series of datetimes or ISO 8601 strings
+
+    Returns:
+        Series with datetime64 dtype and no timezone
+    """
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Use utc=True to handle timezone-aware strings; cache=True parses repeated timestamps once
+        dates = pd.to_datetime(dates, utc=True, cache=True)
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    return dates
+
+
+def _type_codes(types: pd.Series) -> np.ndarray:
+    """
+    Code transaction types as DEPOSIT, WITHDRAWAL or OTHER_TYPE.
+
+    Args:
+        types: The transactions 'type' column
+
+    Returns:
+        int8 array aligned with types
+    """
+    values = types.to_numpy()
+    return np.select(
+        [values == 'deposit', values == 'withdrawal'],
+        [DEPOSIT, WITHDRAWAL],
+        default=OTHER_TYPE
+    ).astype(np.int8)
+
+
+def _date_range_mask(dates: pd.Series, start_date: str = None, end_date: str = None) -> pd.Series:
+    """
+    Build a boolean mask selecting dates within an inclusive YYYY-MM-DD range.
+
+    Args:
+        dates: Timezone-naive datetime Series (see _ensure_datetime)
+        start_date: Optional start date (YYYY-MM-DD)
+        end_date: Optional end date (YYYY-MM-DD)
+
+    Returns:
+        Boolean Series aligned with dates
+    """
+    if not start_date and not end_date:
+        return pd.Series(True, index=dates.index)
+
+    # Bounds stay numpy scalars so they compare directly with the datetime64 values
+    start = np.datetime64(start_date, 'ns') if start_date else _MIN_DATE
+    # Add one day to include all transactions on the end date
+    end = np.datetime64(end_date, 'ns') + np.timedelta64(1, 'D') if end_date else _MAX_DATE
+    values = dates.to_numpy()
+
+    # Date-ordered input (the API returns newest first) is bounded with a
+    # binary search instead of comparing every row against both ends
+    ascending = dates.is_monotonic_increasing
+    if ascending or dates.is_monotonic_decreasing:
+        bounds = np.array([start, end])
+        if ascending:
+            lo, hi = np.searchsorted(values, bounds)
+        else:
+            first, last = np.searchsorted(values[::-1], bounds)
+            lo, hi = len(values) - last, len(values) - first
+        mask = np.zeros(len(values), dtype=bool)
+        mask[lo:hi] = True
+    else:
+        mask = (values >= start) & (values < end)
+
+    return pd.Series(mask, index=dates.index)
+
+
+def _fill_blank_names(names: pd.Series, placeholder: str) -> pd.Series:
+    """
+    Replace missing and empty names with a placeholder in a single pass.
+
+    Args:
+        names: Series of account or category names
+        placeholder: Label to use for blank entries (e.g. 'Uncategorized')
+
+    Returns:
+        Series with every None/NaN/empty name replaced
+    """
+    return names.mask(names.isna() | (names == ''), placeholder)
+
+
+def _sum_and_count_by(names: pd.Series, amounts: pd.Series, name_column: str) -> pd.DataFrame:
+    """
+    Total and count amounts per name with one factorize and two bincounts.
+
+    Args:
+        names: Group labels without missing values (see _fill_blank_names)
+        amounts: Transaction amounts aligned with names
+        name_column: Column name for the labels in the result
+
+    Returns:
+        DataFrame with columns: <name_column>, total_amount, transaction_count
+        in order of first appearance; NaN amounts are skipped like groupby().sum()
+    """
+    codes, uniques = pd.factorize(names.to_numpy(), sort=False)
+    values = amounts.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+
+    return pd.DataFrame({
+        name_column: uniques.astype(object),
+        'total_amount': np.bincount(codes, weights=np.where(present, values, 0.0), minlength=len(uniques)),
+        'transaction_count': np.bincount(codes[present], minlength=len(uniques))
+    })
+
+
+def _period_label(ts: pd.Timestamp, offset: BaseOffset) -> Optional[pd.Timestamp]:
+    """
+    Return the label resample() gives the bin containing a timestamp.
+
+    Args:
+        ts: Timezone-naive timestamp
+        offset: Resample frequency
+
+    Returns:
+        Bin label (start of day for 'D', otherwise the period end), or None for
+        frequencies other than single 'D', 'W', 'ME', 'QE' and 'YE' periods,
+        whose bins are anchored differently
+    """
+    if offset.n != 1:
+        return None
+    if isinstance(offset, Day):
+        return ts.normalize()
+    if isinstance(offset, (Week, MonthEnd, QuarterEnd, YearEnd)):
+        return offset.rollforward(ts.normalize())
+    return None
 
 
 def calculate_net_worth(df: pd.DataFrame) -> Dict[str, float]:
@@ -19,12 +173,16 @@ def calculate_net_worth(df: pd.DataFrame) -> Dict[str, float]:
         Dictionary mapping currency code to net worth amount
     """
     # Filter accounts that should be included in net worth
-    net_worth_accounts = df[df['include_net_worth'] == True]
+    included = (df['include_net_worth'] == True).to_numpy()
+    balances = df['current_balance'].to_numpy(dtype=float)[included]
 
-    # Group by currency and sum balances
-    net_worth_by_currency = net_worth_accounts.groupby('currency_code')['current_balance'].sum().to_dict()
+    # Sum balances per currency with one bincount over the factorized codes,
+    # skipping accounts without a currency or balance like groupby().sum() does
+    codes, currencies = pd.factorize(df['currency_code'].to_numpy()[included])
+    valid = (codes >= 0) & ~np.isnan(balances)
+    totals = np.bincount(codes[valid], weights=balances[valid], minlength=len(currencies))
 
-    return net_worth_by_currency
+    return dict(zip(currencies, totals.tolist()))
 
 
 def calculate_cash_flow(
@@ -42,48 +200,37 @@ def calculate_cash_flow(
         DataFrame with columns: period, income, expenses, net_flow
     """
     if transactions_df.empty:
-        return pd.DataFrame(columns=['period', 'income', 'expenses', 'net_flow'])
+        return _EMPTY_CASH_FLOW.copy(deep=False)
 
-    df = transactions_df.copy()
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Ensure date is datetime
-    # Check if date column is datetime and has timezone info
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make resampling work
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Set date as index for resampling
-    df = df.set_index('date')
-
-    # Separate income and expenses
-    income_df = df[df['type'] == 'deposit'].copy()
-    expense_df = df[df['type'] == 'withdrawal'].copy()
-
-    # Resample and sum by period
-    income_by_period = income_df.resample(period)['amount'].sum()
-    expenses_by_period = expense_df.resample(period)['amount'].sum()
-
-    # Create result dataframe
-    result = pd.DataFrame({
-        'income': income_by_period,
-        'expenses': -expenses_by_period,  # Make expenses negative for display
-        'net_flow': income_by_period - expenses_by_period
-    })
+    # Only deposits and withdrawals count towards cash flow (transfers are skipped)
+    type_codes = _type_codes(transactions_df['type'])
+    in_flow = type_codes != OTHER_TYPE
+    amounts = transactions_df['amount'].to_numpy()[in_flow]
+    is_deposit = type_codes[in_flow] == DEPOSIT
 
-    result = result.reset_index()
-    result.columns = ['period', 'income', 'expenses', 'net_flow']
+    # Pivot amounts into income/expense columns so a single resample covers both
+    flows = pd.DataFrame(
+        {
+            'income': np.where(is_deposit, amounts, 0.0),
+            'expenses': np.where(is_deposit, 0.0, amounts)
+        },
+        index=pd.DatetimeIndex(dates.to_numpy()[in_flow], name='period')
+    )
+    offset = to_offset(period)
+    first_label = _period_label(flows.index.min(), offset) if not flows.empty else None
+    if first_label is not None and first_label == _period_label(flows.index.max(), offset):
+        # Everything falls into one period (e.g. the current month), no resampler needed
+        by_period = flows.sum().to_frame(first_label).T.rename_axis('period')
+    else:
+        by_period = flows.resample(period).sum()
 
-    # Fill NaN with 0
-    result = result.fillna(0)
+    # Finish the result in place on the aggregated frame
+    by_period['expenses'] = 0.0 - by_period['expenses']  # Make expenses negative for display
+    by_period['net_flow'] = by_period['income'] + by_period['expenses']
 
-    return result
+    return by_period.reset_index()
 
 
 def calculate_category_spending(
@@ -103,44 +250,21 @@ def calculate_category_spending(
         DataFrame with columns: category_name, total_amount, transaction_count
     """
     if transactions_df.empty:
-        return pd.DataFrame(columns=['category_name', 'total_amount', 'transaction_count'])
+        return _EMPTY_CATEGORY_SPENDING.copy(deep=False)
 
-    df = transactions_df.copy()
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make comparisons work
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Filter by date range if provided
-    if start_date:
-        start_dt = pd.to_datetime(start_date)
-        df = df[df['date'] >= start_dt]
-    if end_date:
-        # Add one day to include all transactions on the end date
-        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-        df = df[df['date'] < end_dt]
-
-    # Filter for expenses only (withdrawals)
-    expense_df = df[df['type'] == 'withdrawal'].copy()
+    # Filter by type and date range if provided
+    mask = (_type_codes(transactions_df['type']) == WITHDRAWAL) & _date_range_mask(dates, start_date, end_date)
 
-    # Replace None and empty category names with 'Uncategorized'
-    expense_df['category_name'] = expense_df['category_name'].fillna('Uncategorized')
-    expense_df['category_name'] = expense_df['category_name'].replace('', 'Uncategorized')
+    # Expenses only (withdrawals); boolean indexing already returns a new frame
+    expense_df = transactions_df[mask]
 
-    # Group by category
-    category_summary = expense_df.groupby('category_name').agg({
-        'amount': ['sum', 'count']
-    }).reset_index()
+    # Replace None and empty category names with 'Uncategorized'
+    category_names = _fill_blank_names(expense_df['category_name'], 'Uncategorized')
 
-    category_summary.columns = ['category_name', 'total_amount', 'transaction_count']
+    # Total per category
+    category_summary = _sum_and_count_by(category_names, expense_df['amount'], 'category_name')
 
     # Sort by total amount descending
     category_summary = category_summary.sort_values('total_amount', ascending=False)
@@ -165,44 +289,21 @@ def calculate_income_sources(
         DataFrame with columns: source_name, total_amount, transaction_count
     """
     if transactions_df.empty:
-        return pd.DataFrame(columns=['source_name', 'total_amount', 'transaction_count'])
+        return _EMPTY_INCOME_SOURCES.copy(deep=False)
 
-    df = transactions_df.copy()
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make comparisons work
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Filter by date range if provided
-    if start_date:
-        start_dt = pd.to_datetime(start_date)
-        df = df[df['date'] >= start_dt]
-    if end_date:
-        # Add one day to include all transactions on the end date
-        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-        df = df[df['date'] < end_dt]
-
-    # Filter for income only (deposits)
-    income_df = df[df['type'] == 'deposit'].copy()
+    # Filter by type and date range if provided
+    mask = (_type_codes(transactions_df['type']) == DEPOSIT) & _date_range_mask(dates, start_date, end_date)
 
-    # Replace None and empty source names with 'Unknown'
-    income_df['source_name'] = income_df['source_name'].fillna('Unknown')
-    income_df['source_name'] = income_df['source_name'].replace('', 'Unknown')
+    # Income only (deposits)
+    income_df = transactions_df[mask]
 
-    # Group by source
-    source_summary = income_df.groupby('source_name').agg({
-        'amount': ['sum', 'count']
-    }).reset_index()
+    # Replace None and empty source names with 'Unknown'
+    source_names = _fill_blank_names(income_df['source_name'], 'Unknown')
 
-    source_summary.columns = ['source_name', 'total_amount', 'transaction_count']
+    # Total per source
+    source_summary = _sum_and_count_by(source_names, income_df['amount'], 'source_name')
 
     # Sort by total amount descending
     source_summary = source_summary.sort_values('total_amount', ascending=False)
@@ -256,40 +357,24 @@ def calculate_period_comparison(
             'change_pct': {'income': 0, 'expenses': 0, 'net': 0}
         }
 
-    df = transactions_df.copy()
-    # Check if date column is datetime and has timezone info
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make comparisons work
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Prepare date filters (no timezone needed since we removed it from df['date'])
-    # Add one day to end dates to include all transactions on those dates
-    current_start_dt = pd.to_datetime(current_start)
-    current_end_dt = pd.to_datetime(current_end) + pd.Timedelta(days=1)
-    previous_start_dt = pd.to_datetime(previous_start)
-    previous_end_dt = pd.to_datetime(previous_end) + pd.Timedelta(days=1)
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Current period
-    current_df = df[(df['date'] >= current_start_dt) &
-                    (df['date'] < current_end_dt)]
+    # A period's income and expenses come out of a single weighted bincount over the type codes
+    type_codes = _type_codes(transactions_df['type'])
+    amounts = np.nan_to_num(transactions_df['amount'].to_numpy(dtype=float))
 
-    current_income = current_df[current_df['type'] == 'deposit']['amount'].sum()
-    current_expenses = current_df[current_df['type'] == 'withdrawal']['amount'].sum()
+    # Current period
+    in_current = _date_range_mask(dates, current_start, current_end).to_numpy()
+    current_income, current_expenses, _ = np.bincount(
+        type_codes[in_current], weights=amounts[in_current], minlength=3
+    )
     current_net = current_income - current_expenses
 
     # Previous period
-    previous_df = df[(df['date'] >= previous_start_dt) &
-                     (df['date'] < previous_end_dt)]
-
-    previous_income = previous_df[previous_df['type'] == 'deposit']['amount'].sum()
-    previous_expenses = previous_df[previous_df['type'] == 'withdrawal']['amount'].sum()
+    in_previous = _date_range_mask(dates, previous_start, previous_end).to_numpy()
+    previous_income, previous_expenses, _ = np.bincount(
+        type_codes[in_previous], weights=amounts[in_previous], minlength=3
+    )
     previous_net = previous_income - previous_expenses
 
     # Calculate changes
@@ -336,57 +421,19 @@ def get_date_ranges(period_type: str = 'month') -> Dict[str, Tuple[str, str]]:
     Returns:
         Dictionary with date ranges (start, end) for current and previous periods
     """
-    today = datetime.now()
-
-    if period_type == 'month':
-        # Current month
-        current_start = today.replace(day=1)
-        if today.month == 12:
-            current_end = today.replace(day=31)
-        else:
-            current_end = (today.replace(day=1, month=today.month + 1) - timedelta(days=1))
-
-        # Previous month
-        if today.month == 1:
-            previous_start = today.replace(year=today.year - 1, month=12, day=1)
-            previous_end = today.replace(year=today.year - 1, month=12, day=31)
-        else:
-            previous_start = today.replace(month=today.month - 1, day=1)
-            previous_end = (today.replace(day=1) - timedelta(days=1))
-
-    elif period_type == 'quarter':
-        # Current quarter
-        current_quarter = (today.month - 1) // 3 + 1
-        current_start = today.replace(month=(current_quarter - 1) * 3 + 1, day=1)
-        current_end = today
-
-        # Previous quarter
-        if current_quarter == 1:
-            previous_quarter = 4
-            previous_year = today.year - 1
-        else:
-            previous_quarter = current_quarter - 1
-            previous_year = today.year
-
-        previous_start = today.replace(year=previous_year, month=(previous_quarter - 1) * 3 + 1, day=1)
-        previous_end_month = previous_quarter * 3
-        previous_end = (today.replace(year=previous_year, month=previous_end_month + 1, day=1) - timedelta(days=1))
-
-    elif period_type == 'year':
-        # Current year
-        current_start = today.replace(month=1, day=1)
-        current_end = today
+    if period_type not in DATE_RANGE_FREQS:
+        raise ValueError(f"Unknown period_type: {period_type}")
 
-        # Previous year
-        previous_start = today.replace(year=today.year - 1, month=1, day=1)
-        previous_end = today.replace(year=today.year - 1, month=12, day=31)
+    today = pd.Timestamp.now().normalize()
+    current = today.to_period(DATE_RANGE_FREQS[period_type])
+    previous = current - 1
 
-    else:
-        raise ValueError(f"Unknown period_type: {period_type}")
+    # The current month is shown in full; quarter and year ranges run to date
+    current_end = current.end_time if period_type == 'month' else today
 
     return {
-        'current': (current_start.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')),
-        'previous': (previous_start.strftime('%Y-%m-%d'), previous_end.strftime('%Y-%m-%d'))
+        'current': (current.start_time.strftime('%Y-%m-%d'), current_end.strftime('%Y-%m-%d')),
+        'previous': (previous.start_time.strftime('%Y-%m-%d'), previous.end_time.strftime('%Y-%m-%d'))
     }
 
 
@@ -413,6 +460,13 @@ def calculate_budget_performance(
     if not budgets_data:
         return pd.DataFrame(columns=['budget_name', 'budget_id', 'budgeted', 'spent', 'remaining', 'utilization_pct', 'status'])
 
+    # Spent per budget from a single groupby over withdrawals rather than one scan per budget
+    if not transactions_df.empty:
+        withdrawals = transactions_df[_type_codes(transactions_df['type']) == WITHDRAWAL]
+        spent_by_budget = withdrawals.groupby('budget_name', sort=False)['amount'].sum()
+    else:
+        spent_by_budget = pd.Series(dtype=float)
+
     budget_performance = []
 
     # Parse the selected date range
@@ -451,39 +505,25 @@ def calculate_budget_performance(
                     prorated_amount = (limit_amount * overlap_days) / total_limit_days if total_limit_days > 0 else limit_amount
                     budgeted_amount += prorated_amount
 
-        # Calculate spent amount from transactions
-        if not transactions_df.empty:
-            budget_transactions = transactions_df[
-                (transactions_df['budget_name'] == budget_name) &
-                (transactions_df['type'] == 'withdrawal')
-            ]
-            spent_amount = budget_transactions['amount'].sum()
-        else:
-            spent_amount = 0.0
-
-        # Calculate remaining and utilization
-        remaining = budgeted_amount - spent_amount
-        utilization_pct = (spent_amount / budgeted_amount * 100) if budgeted_amount > 0 else 0
-
-        # Determine status
-        if utilization_pct >= 100:
-            status = 'Over Budget'
-        elif utilization_pct >= 80:
-            status = 'Warning'
-        else:
-            status = 'On Track'
-
         budget_performance.append({
             'budget_name': budget_name,
             'budget_id': budget_id,
-            'budgeted': budgeted_amount,
-            'spent': spent_amount,
-            'remaining': remaining,
-            'utilization_pct': utilization_pct,
-            'status': status
+            'budgeted': budgeted_amount
         })
 
     df = pd.DataFrame(budget_performance)
+    df['spent'] = df['budget_name'].map(spent_by_budget).fillna(0.0)
+
+    # Calculate remaining and utilization
+    budgeted = df['budgeted'].to_numpy(dtype=float)
+    spent = df['spent'].to_numpy(dtype=float)
+    df['remaining'] = budgeted - spent
+    utilization_pct = np.divide(spent, budgeted, out=np.zeros_like(budgeted), where=budgeted > 0) * 100
+    df['utilization_pct'] = utilization_pct
+
+    # Determine status: the bin a utilization falls into indexes its label
+    status_bins = np.searchsorted([80.0, 100.0], utilization_pct, side='right')
+    df['status'] = np.array(['On Track', 'Warning', 'Over Budget'])[status_bins]
 
     # Sort by utilization percentage descending
     df = df.sort_values('utilization_pct', ascending=False)
@@ -511,24 +551,22 @@ def calculate_budget_burn_rate(
     Returns:
         Dictionary with burn_rate, days_elapsed, days_remaining, projected_spend, projected_over_under
     """
-    start = pd.to_datetime(start_date)
-    end = pd.to_datetime(end_date)
-    today = pd.Timestamp.now()
-    
+    # Work in day ordinals; every quantity below is a whole number of days
+    start = date.fromisoformat(start_date).toordinal()
+    end = date.fromisoformat(end_date).toordinal()
+    today = date.today().toordinal()
+
     # Determine the effective "current" date for calculations
     if current_date:
-        current = pd.to_datetime(current_date)
-    elif end < today:
-        # Period has already ended - use the end date
-        current = end
+        current = date.fromisoformat(current_date).toordinal()
     else:
-        # Period is ongoing - use today but cap at end date
+        # Use today, capped at the end date once the period is over
         current = min(today, end)
 
     # Calculate days
-    total_days = (end - start).days + 1
-    days_elapsed = min((current - start).days + 1, total_days)  # Can't exceed total days
-    days_remaining = max(0, (end - current).days)
+    total_days = end - start + 1
+    days_elapsed = min(current - start + 1, total_days)  # Can't exceed total days
+    days_remaining = max(0, end - current)
 
     # Prevent division by zero
     days_elapsed = max(1, days_elapsed)
@@ -536,8 +574,8 @@ def calculate_budget_burn_rate(
     # Calculate burn rate (spend per day)
     burn_rate = spent / days_elapsed if days_elapsed > 0 else 0
 
-    # For completed periods, no projection needed
-    if end < today:
+    # For completed periods (including one ending today), no projection needed
+    if end <= today:
         projected_spend = spent  # Actual final amount
         projected_over_under = budgeted - spent  # Actual over/under
     else:
@@ -573,32 +611,27 @@ def calculate_daily_budget_pace(
     Returns:
         DataFrame with columns: day, ideal_cumulative, actual_cumulative (for current day only)
     """
-    start = pd.to_datetime(start_date)
-    end = pd.to_datetime(end_date)
-    today = pd.Timestamp.now()
-
-    # Generate date range
-    date_range = pd.date_range(start=start, end=end, freq='D')
+    # Generate date range in whole days
+    date_range = np.arange(
+        np.datetime64(start_date, 'D'),
+        np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+    )
 
     total_days = len(date_range)
     daily_budget = budgeted / total_days if total_days > 0 else 0
 
-    data = []
-    for i, date in enumerate(date_range):
-        day_number = i + 1
-        ideal_cumulative = daily_budget * day_number
-
-        # Only show actual for current day
-        actual_cumulative = spent if date.date() == today.date() else None
+    day_number = np.arange(1, total_days + 1)
 
-        data.append({
-            'day': day_number,
-            'date': date,
-            'ideal_cumulative': ideal_cumulative,
-            'actual_cumulative': actual_cumulative
-        })
+    # Only show actual for current day
+    actual_cumulative = np.full(total_days, np.nan)
+    actual_cumulative[date_range == np.datetime64(date.today(), 'D')] = spent
 
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'day': day_number,
+        'date': date_range.astype('datetime64[ns]'),
+        'ideal_cumulative': daily_budget * day_number,
+        'actual_cumulative': actual_cumulative
+    })
 
 
 def calculate_category_trends(
@@ -619,27 +652,17 @@ def calculate_category_trends(
         return pd.DataFrame(columns=['date', 'category_name', 'amount'])
 
     # Filter for expenses only
-    df = transactions_df[transactions_df['type'] == 'withdrawal'].copy()
+    is_expense = _type_codes(transactions_df['type']) == WITHDRAWAL
+    df = transactions_df[is_expense]
 
     if df.empty:
         return pd.DataFrame(columns=['date', 'category_name', 'amount'])
 
-    # Replace None/empty categories
-    df['category_name'] = df['category_name'].fillna('Uncategorized')
-    df['category_name'] = df['category_name'].replace('', 'Uncategorized')
-
-    # Ensure date is datetime
-    # Check if date column is datetime and has timezone info
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make grouping work
-        df['date'] = df['date'].dt.tz_localize(None)
+    # Timezone-naive dates and filled-in categories on a single new frame
+    df = df.assign(
+        date=_ensure_datetime(transactions_df['date'])[is_expense],
+        category_name=_fill_blank_names(df['category_name'], 'Uncategorized')
+    )
 
     # Group by period and category
     df_grouped = df.groupby([pd.Grouper(key='date', freq=period), 'category_name'])['amount'].sum().reset_index()
@@ -669,26 +692,16 @@ def calculate_category_monthly_comparison(
         return pd.DataFrame(columns=['month', 'amount', 'change', 'change_pct'])
 
     # Filter for specific category and expenses
-    df = transactions_df[
+    in_category = (
         (transactions_df['category_name'] == category_name) &
-        (transactions_df['type'] == 'withdrawal')
-    ].copy()
+        (_type_codes(transactions_df['type']) == WITHDRAWAL)
+    )
+    df = transactions_df[in_category]
 
     if df.empty:
         return pd.DataFrame(columns=['month', 'amount', 'change', 'change_pct'])
 
-    # Ensure date is datetime
-    # Check if date column is datetime and has timezone info
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make grouping work
-        df['date'] = df['date'].dt.tz_localize(None)
+    df = df.assign(date=_ensure_datetime(transactions_df['date'])[in_category])
 
     # Group by month
     monthly = df.groupby(pd.Grouper(key='date', freq='ME'))['amount'].sum().reset_index()
@@ -720,42 +733,13 @@ def calculate_category_percentage(
     if transactions_df.empty:
         return pd.DataFrame(columns=['category_name', 'amount', 'percentage', 'cumulative_pct'])
 
-    df = transactions_df.copy()
+    # Reuse the per-category totals (already sorted by amount descending)
+    category_spending = calculate_category_spending(transactions_df, start_date, end_date)
 
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            # Already datetime with timezone - just remove timezone
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        # Convert date column to datetime if it's not already
-        # Use utc=True to handle timezone-aware datetime objects
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        # Remove timezone to make comparisons work
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Filter by date range if provided
-    if start_date:
-        start_dt = pd.to_datetime(start_date)
-        df = df[df['date'] >= start_dt]
-    if end_date:
-        # Add one day to include all transactions on the end date
-        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-        df = df[df['date'] < end_dt]
-
-    # Filter for expenses only
-    df = df[df['type'] == 'withdrawal'].copy()
-
-    if df.empty:
+    if category_spending.empty:
         return pd.DataFrame(columns=['category_name', 'amount', 'percentage', 'cumulative_pct'])
 
-    # Replace None/empty categories
-    df['category_name'] = df['category_name'].fillna('Uncategorized')
-    df['category_name'] = df['category_name'].replace('', 'Uncategorized')
-
-    # Group by category
-    category_totals = df.groupby('category_name')['amount'].sum().reset_index()
-    category_totals.columns = ['category_name', 'amount']
+    category_totals = category_spending[['category_name', 'total_amount']].rename(columns={'total_amount': 'amount'})
 
     # Calculate total expenses
     total_expenses = category_totals['amount'].sum()
@@ -763,9 +747,6 @@ def calculate_category_percentage(
     # Calculate percentage
     category_totals['percentage'] = (category_totals['amount'] / total_expenses * 100) if total_expenses > 0 else 0
 
-    # Sort by amount descending
-    category_totals = category_totals.sort_values('amount', ascending=False)
-
     # Calculate cumulative percentage
     category_totals['cumulative_pct'] = category_totals['percentage'].cumsum()
 
@@ -792,7 +773,7 @@ def get_top_transactions_by_category(
         return pd.DataFrame(columns=['date', 'description', 'amount', 'destination_name'])
 
     # Filter for specific category
-    df = transactions_df[transactions_df['category_name'] == category_name].copy()
+    df = transactions_df[transactions_df['category_name'] == category_name]
 
     if df.empty:
         return pd.DataFrame(columns=['date', 'description', 'amount', 'destination_name'])
@@ -831,7 +812,8 @@ def calculate_category_statistics(
         }
 
     # Filter for specific category
-    df = transactions_df[transactions_df['category_name'] == category_name].copy()
+    in_category = transactions_df['category_name'] == category_name
+    df = transactions_df[in_category]
 
     if df.empty:
         return {
@@ -843,13 +825,7 @@ def calculate_category_statistics(
             'count': 0
         }
 
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        df['date'] = df['date'].dt.tz_localize(None)
+    df = df.assign(date=_ensure_datetime(transactions_df['date'])[in_category])
 
     # Calculate monthly totals
     monthly_totals = df.groupby(pd.Grouper(key='date', freq='ME'))['amount'].sum()
@@ -965,24 +941,13 @@ def calculate_import_batches(
     if transactions_df.empty or 'created_at' not in transactions_df.columns:
         return pd.DataFrame(columns=['import_date', 'transaction_count', 'earliest_txn_date', 'latest_txn_date', 'unique_tags'])
 
-    df = transactions_df.copy()
-
-    # Ensure created_at is datetime
-    if not pd.api.types.is_datetime64_any_dtype(df['created_at']):
-        df['created_at'] = pd.to_datetime(df['created_at'], utc=True)
-
-    # Ensure date is datetime
-    if not pd.api.types.is_datetime64_any_dtype(df['date']):
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-
-    # Remove timezone for grouping
-    if hasattr(df['created_at'].dt, 'tz') and df['created_at'].dt.tz is not None:
-        df['created_at'] = df['created_at'].dt.tz_localize(None)
-    if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Group by import date (truncate to date only)
-    df['import_date'] = df['created_at'].dt.date
+    # Ensure created_at and date are datetime without timezone for grouping
+    created_at = _ensure_datetime(transactions_df['created_at'])
+    df = transactions_df.assign(
+        created_at=created_at,
+        date=_ensure_datetime(transactions_df['date']),
+        import_date=created_at.dt.date  # Group by import date (truncate to date only)
+    )
 
     # Aggregate by import date
     batches = df.groupby('import_date').agg({
@@ -1018,22 +983,12 @@ def calculate_import_gap(
     if transactions_df.empty or 'date' not in transactions_df.columns or 'created_at' not in transactions_df.columns:
         return pd.DataFrame(columns=['tag_name', 'avg_gap_days', 'min_gap_days', 'max_gap_days', 'transaction_count'])
 
-    df = transactions_df.copy()
-
-    # Ensure dates are datetime
-    if not pd.api.types.is_datetime64_any_dtype(df['date']):
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-    if not pd.api.types.is_datetime64_any_dtype(df['created_at']):
-        df['created_at'] = pd.to_datetime(df['created_at'], utc=True)
-
-    # Remove timezone
-    if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-        df['date'] = df['date'].dt.tz_localize(None)
-    if hasattr(df['created_at'].dt, 'tz') and df['created_at'].dt.tz is not None:
-        df['created_at'] = df['created_at'].dt.tz_localize(None)
+    # Ensure dates are datetime without timezone
+    dates = _ensure_datetime(transactions_df['date'])
+    created_at = _ensure_datetime(transactions_df['created_at'])
 
     # Calculate gap in days
-    df['gap_days'] = (df['created_at'] - df['date']).dt.total_seconds() / 86400
+    df = transactions_df.assign(gap_days=(created_at - dates).dt.total_seconds() / 86400)
 
     # Explode tags
     df_exploded = df.explode('tags')
@@ -1100,38 +1055,18 @@ def calculate_destination_accounts_spending(
     if transactions_df.empty:
         return pd.DataFrame(columns=['destination_name', 'total_amount', 'transaction_count'])
 
-    df = transactions_df.copy()
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Filter by date range if provided
-    if start_date:
-        start_dt = pd.to_datetime(start_date)
-        df = df[df['date'] >= start_dt]
-    if end_date:
-        # Add one day to include all transactions on the end date
-        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-        df = df[df['date'] < end_dt]
-
-    # Filter for expenses only (withdrawals)
-    expense_df = df[df['type'] == 'withdrawal'].copy()
+    # Filter for expenses only (withdrawals) within the date range if provided
+    expense_df = transactions_df[
+        (_type_codes(transactions_df['type']) == WITHDRAWAL) & _date_range_mask(dates, start_date, end_date)
+    ]
 
     # Replace None and empty destination names with 'Unknown'
-    expense_df['destination_name'] = expense_df['destination_name'].fillna('Unknown')
-    expense_df['destination_name'] = expense_df['destination_name'].replace('', 'Unknown')
-
-    # Group by destination account
-    destination_summary = expense_df.groupby('destination_name').agg({
-        'amount': ['sum', 'count']
-    }).reset_index()
+    destination_names = _fill_blank_names(expense_df['destination_name'], 'Unknown')
 
-    destination_summary.columns = ['destination_name', 'total_amount', 'transaction_count']
+    # Total per destination account
+    destination_summary = _sum_and_count_by(destination_names, expense_df['amount'], 'destination_name')
 
     # Sort by total amount descending
     destination_summary = destination_summary.sort_values('total_amount', ascending=False)
@@ -1158,33 +1093,18 @@ def calculate_destination_to_category_mapping(
     if transactions_df.empty:
         return pd.DataFrame(columns=['destination_name', 'category_name', 'total_amount'])
 
-    df = transactions_df.copy()
-
-    # Ensure date is datetime and handle timezone
-    if pd.api.types.is_datetime64_any_dtype(df['date']):
-        if hasattr(df['date'].dt, 'tz') and df['date'].dt.tz is not None:
-            df['date'] = df['date'].dt.tz_localize(None)
-    else:
-        df['date'] = pd.to_datetime(df['date'], utc=True)
-        df['date'] = df['date'].dt.tz_localize(None)
-
-    # Filter by date range if provided
-    if start_date:
-        start_dt = pd.to_datetime(start_date)
-        df = df[df['date'] >= start_dt]
-    if end_date:
-        # Add one day to include all transactions on the end date
-        end_dt = pd.to_datetime(end_date) + pd.Timedelta(days=1)
-        df = df[df['date'] < end_dt]
+    dates = _ensure_datetime(transactions_df['date'])
 
-    # Filter for expenses only (withdrawals)
-    expense_df = df[df['type'] == 'withdrawal'].copy()
+    # Filter for expenses only (withdrawals) within the date range if provided
+    expense_df = transactions_df[
+        (_type_codes(transactions_df['type']) == WITHDRAWAL) & _date_range_mask(dates, start_date, end_date)
+    ]
 
     # Replace None and empty names
-    expense_df['destination_name'] = expense_df['destination_name'].fillna('Unknown')
-    expense_df['destination_name'] = expense_df['destination_name'].replace('', 'Unknown')
-    expense_df['category_name'] = expense_df['category_name'].fillna('Uncategorized')
-    expense_df['category_name'] = expense_df['category_name'].replace('', 'Uncategorized')
+    expense_df = expense_df.assign(
+        destination_name=_fill_blank_names(expense_df['destination_name'], 'Unknown'),
+        category_name=_fill_blank_names(expense_df['category_name'], 'Uncategorized')
+    )
 
     # Group by destination and category
     mapping = expense_df.groupby(['destination_name', 'category_name']).agg({